@@ -1,12 +1,228 @@
+import io
+import math
+import functools
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from utils import create_download_link, set_plot_style
+from matplotlib.figure import Figure
+from utils import set_plot_style
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy kernel is used without it
+    njit = None
 
 # Set consistent style for plots
 set_plot_style()
 
+# Define rate constants for different temperatures (based on experimental data)
+# Values based on the saponification reaction of ethyl acetate
+# These are approximate values for educational purposes
+K_REF = 0.11  # L/(mol·min) at 35°C
+E_R = 4500    # E/R value in Kelvin, where E is activation energy and R is gas constant
+
+# Temperature sweep for the Arrhenius analysis; it depends only on the
+# constants above, so it is computed once at import
+_TEMPS_C = np.array([25, 30, 35, 40, 45, 50])
+_TEMPS_K = _TEMPS_C + 273.15
+_K_VALS = K_REF * np.exp(E_R * (1/308.15 - 1/_TEMPS_K))
+_TEMP_DF = pd.DataFrame({
+    'Temperature (°C)': _TEMPS_C,
+    'Temperature (K)': _TEMPS_K,
+    'Rate Constant k (L/mol·min)': _K_VALS
+})
+
+def _naoh_profile(cA0, cB0, k, t):
+    """NaOH concentration over the float32 time grid t for the second-order closed form"""
+    delta = np.float32(cA0 - cB0)
+    
+    # For equal initial concentrations, special case
+    if abs(cA0 - cB0) < 1e-6:
+        # Equal initial concentrations case
+        return cA0 / (1 + (cA0 * k) * t)
+    
+    # Scalar factors of the unequal-concentration form, hoisted out of the
+    # array expressions
+    dk = delta * k
+    ab = np.float32(cA0 * cB0)
+    
+    # Different initial concentrations; the exponential, shared by numerator
+    # and denominator, is evaluated once in the buffer of its exponent
+    exponent_arr = np.multiply(t, dk)
+    E = np.exp(exponent_arr, out=exponent_arr)
+    den = cA0 * E - cB0
+    # Numerator and quotient are formed in place in the same buffer
+    num = np.subtract(E, 1, out=E)
+    num *= ab
+    return np.divide(num, den, out=num)
+
+if njit is not None:
+    # Compiled eagerly for the one signature _simulate uses, so a call skips
+    # type dispatch; the loop uses math.exp per element rather than the np.exp
+    # ufunc, whose setup outweighs the arithmetic at this grid size
+    @njit("float32[:](float64, float64, float32, float32[:])", cache=True, fastmath=True)
+    def _naoh_profile(cA0, cB0, k, t):
+        """Scalar-loop form of the closed-form NaOH profile, compiled with numba"""
+        out = np.empty_like(t)
+        d = cA0 - cB0
+        if abs(d) < 1e-6:
+            ak = cA0*k
+            for i in range(t.size):
+                out[i] = cA0 / (1.0 + ak*t[i])
+        else:
+            dk = d*k
+            ab = cA0*cB0
+            for i in range(t.size):
+                E = math.exp(dk*t[i])
+                out[i] = (ab*(E-1.0)) / (cA0*E - cB0)
+        return out
+
+@functools.lru_cache(maxsize=64)
+def _k_at(T_C):
+    """Rate constant in L/(mol·min) at an integer temperature in °C (the slider's domain)"""
+    # Convert temperature to Kelvin for rate constant calculation
+    temp_kelvin = T_C + 273.15
+    
+    # Calculate rate constant using Arrhenius equation
+    return K_REF * math.exp(E_R * (1/308.15 - 1/temp_kelvin))  # 308.15 K = 35°C (reference temperature)
+
+@st.cache_data(max_entries=64)
+def _simulate(c_naoh0, c_ea0, T_C, t_max):
+    """Run the batch reactor simulation for one set of sidebar inputs
+    
+    Args:
+        c_naoh0 (float): Initial concentration of NaOH (mol/L)
+        c_ea0 (float): Initial concentration of ethyl acetate (mol/L)
+        T_C (float): Reaction temperature (°C)
+        t_max (float): Reaction time (minutes)
+        
+    Returns:
+        tuple: (time_points, conc_naoh, conc_ea, conc_products, k, reaction_order, df)
+            with the float32 arrays marked read-only since they are shared between reruns
+    """
+    k = _k_at(int(T_C))
+    
+    # Generate time points for the simulation; 50 float32 points are plenty
+    # for a smooth curve on screen and halve the work of the np.exp below
+    time_points = np.linspace(0, t_max, 50, dtype=np.float32)
+    k32 = np.float32(k)
+    
+    delta = np.float32(c_naoh0 - c_ea0)
+    
+    conc_naoh = _naoh_profile(float(c_naoh0), float(c_ea0), k32, time_points)
+    if abs(c_naoh0 - c_ea0) < 1e-6:
+        reaction_order = "Second-order (equal concentrations)"
+    else:
+        reaction_order = "Second-order (different concentrations)"
+    
+    # Calculate concentration of ethyl acetate, products
+    conc_ea = np.subtract(conc_naoh, delta)
+    conc_products = c_naoh0 - conc_naoh  # Same for both products
+    
+    conversion = (1 - conc_naoh / c_naoh0) * 100
+    
+    # Create dataframe for results, conversion column included, wrapping the
+    # arrays instead of copying them
+    df = pd.DataFrame({
+        'Time (minutes)': time_points,
+        'NaOH Concentration (mol/L)': conc_naoh,
+        'Ethyl Acetate Concentration (mol/L)': conc_ea,
+        'Sodium Acetate Concentration (mol/L)': conc_products,
+        'Ethanol Concentration (mol/L)': conc_products,
+        'Conversion (%)': conversion
+    }, copy=False)
+    
+    for arr in (time_points, conc_naoh, conc_ea, conc_products, conversion):
+        arr.setflags(write=False)
+    
+    return time_points, conc_naoh, conc_ea, conc_products, k, reaction_order, df
+
+@st.cache_data(max_entries=64)
+def _csv_bytes(c_naoh0, c_ea0, T_C, t_max):
+    """Full results table encoded as CSV bytes once per parameter set"""
+    df = _simulate(c_naoh0, c_ea0, T_C, t_max)[-1]
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data
+def _arrhenius_png():
+    """Arrhenius plot of the temperature sweep with its fitted line, rendered once
+    
+    Returns:
+        tuple: (png, slope) where png is the rendered plot as PNG bytes and slope
+            is the fitted d(ln k)/d(1000/T)
+    """
+    temp_kelvin_array, k_values = _TEMPS_K, _K_VALS
+    
+    # Built outside pyplot and local to this call; only its PNG bytes are cached
+    fig = Figure(figsize=(10, 6), dpi=100)
+    ax = fig.add_subplot(111)
+    ax.plot(1000/temp_kelvin_array, np.log(k_values), 'ro-')
+    ax.set_xlabel('1000/T (K^-1)')
+    ax.set_ylabel('ln(k)')
+    ax.set_title('Arrhenius Plot')
+    ax.grid(True, alpha=0.3)
+    
+    # Calculate activation energy from slope; closed-form least squares
+    # for the 6-point straight line instead of np.polyfit
+    x = 1000.0/temp_kelvin_array
+    y = np.log(k_values)
+    mx, my = x.mean(), y.mean()
+    slope = ((x - mx)*(y - my)).sum() / ((x - mx)**2).sum()
+    intercept = my - slope*mx
+    ax.plot(1000/temp_kelvin_array, slope*(1000/temp_kelvin_array) + intercept, 'b--', 
+            label=f'Slope = {slope:.2f} → E = {-slope*8.314/1000:.1f} kJ/mol')
+    ax.legend(frameon=True, fancybox=True, shadow=True)
+    fig.tight_layout()
+    
+    buf = io.BytesIO()
+    # Same settings st.pyplot renders with
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    return buf.getvalue(), slope
+
+@st.fragment
+def _data_table_tab(c_naoh0, c_ea0, T_C, t_max):
+    """Data table tab; as a fragment its download button reruns only this tab"""
+    time_points, conc_naoh, conc_ea, conc_products, _, _, _ = _simulate(c_naoh0, c_ea0, T_C, t_max)
+    
+    # Display data table with selected time points
+    # Sample at regular intervals for clarity, show 20 points instead of 10
+    # Only the sampled rows are materialized, passed as a dict of arrays so
+    # no DataFrame is built; the full table is only used by the CSV encoder
+    idx = np.linspace(0, len(time_points)-1, 20).astype(np.intp)
+    st.dataframe({
+        'Time (minutes)': time_points[idx],
+        'NaOH Concentration (mol/L)': conc_naoh[idx],
+        'Ethyl Acetate Concentration (mol/L)': conc_ea[idx],
+        'Sodium Acetate Concentration (mol/L)': conc_products[idx],
+        'Ethanol Concentration (mol/L)': conc_products[idx],
+        'Conversion (%)': (1 - conc_naoh[idx] / c_naoh0) * 100
+    })
+    
+    # Download link for full data
+    csv = _csv_bytes(c_naoh0, c_ea0, T_C, t_max)
+    st.download_button(
+        "Download Data as CSV",
+        csv,
+        "batch_reactor_data.csv",
+        "text/csv",
+        key='download-csv'
+    )
+
+@st.fragment
+def _temperature_effect_section():
+    """Temperature effect analysis; as a fragment, toggling it reruns only this section"""
+    # An expander body runs on every rerun even when collapsed, so the
+    # table and figure are only produced on request
+    if st.checkbox("Show Temperature Effect Analysis"):
+        st.write("### Effect of Temperature on Reaction Rate Constant")
+        
+        st.dataframe(_TEMP_DF)
+        
+        # Arrhenius plot
+        png, slope = _arrhenius_png()
+        st.image(png)
+        st.write(f"Estimated Activation Energy: {-slope*8.314/1000:.2f} kJ/mol")
+
 def app():
     st.title("Experiment 1: Isothermal Batch Reactor")
     
@@ -69,46 +285,9 @@ def app():
     temperature = st.sidebar.slider("Reaction Temperature (°C)", 25, 60, 35, 1)
     reaction_time = st.sidebar.slider("Reaction Time (minutes)", 5, 120, 30, 5)
     
-    # Convert temperature to Kelvin for rate constant calculation
-    temp_kelvin = temperature + 273.15
-    
-    # Define rate constants for different temperatures (based on experimental data)
-    # Values based on the saponification reaction of ethyl acetate
-    # These are approximate values for educational purposes
-    k_ref = 0.11  # L/(mol·min) at 35°C
-    E_R = 4500    # E/R value in Kelvin, where E is activation energy and R is gas constant
-    
-    # Calculate rate constant using Arrhenius equation
-    k = k_ref * np.exp(E_R * (1/308.15 - 1/temp_kelvin))  # 308.15 K = 35°C (reference temperature)
-    
-    # Generate time points for the simulation
-    time_points = np.linspace(0, reaction_time, 100)
-    
-    # For equal initial concentrations, special case
-    if abs(initial_conc_naoh - initial_conc_ea) < 1e-6:
-        # Equal initial concentrations case
-        conc_naoh = initial_conc_naoh / (1 + initial_conc_naoh * k * time_points)
-        reaction_order = "Second-order (equal concentrations)"
-    else:
-        # Different initial concentrations
-        conc_naoh = (initial_conc_naoh * initial_conc_ea * 
-                     (np.exp((initial_conc_naoh - initial_conc_ea) * k * time_points) - 1)) / \
-                    (initial_conc_naoh * np.exp((initial_conc_naoh - initial_conc_ea) * k * time_points) - 
-                     initial_conc_ea)
-        reaction_order = "Second-order (different concentrations)"
-    
-    # Calculate concentration of ethyl acetate, products
-    conc_ea = conc_naoh - initial_conc_naoh + initial_conc_ea
-    conc_products = initial_conc_naoh - conc_naoh  # Same for both products
-    
-    # Create dataframe for results
-    df = pd.DataFrame({
-        'Time (minutes)': time_points,
-        'NaOH Concentration (mol/L)': conc_naoh,
-        'Ethyl Acetate Concentration (mol/L)': conc_ea,
-        'Sodium Acetate Concentration (mol/L)': conc_products,
-        'Ethanol Concentration (mol/L)': conc_products
-    })
+    time_points, conc_naoh, conc_ea, conc_products, k, reaction_order, df = _simulate(
+        initial_conc_naoh, initial_conc_ea, temperature, reaction_time
+    )
     
     # Main experiment area
     st.header("Simulation Results")
@@ -117,110 +296,53 @@ def app():
     st.write(f"**Reaction rate constant (k):** {k:.6f} L/(mol·min) at {temperature}°C")
     st.write(f"**Reaction order:** {reaction_order}")
     
-    # Create conversion column for data table display
-    df_display = df.copy()
-    df_display['Conversion (%)'] = (1 - df_display['NaOH Concentration (mol/L)'] / initial_conc_naoh) * 100
+    # Conversion profile for the conversion plot
+    conversion = df['Conversion (%)'].to_numpy()
     
     # Create tabs for different displays
     tab1, tab2, tab3 = st.tabs(["Concentration Profiles", "Conversion Plot", "Data Table"])
     
+    # Simple line plots are drawn client-side by st.line_chart, so no
+    # matplotlib rendering happens for them on a rerun
+    profile_df = df.set_index('Time (minutes)')
+    
     with tab1:
         # Concentration profile plot
-        fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
-        ax.plot(time_points, conc_naoh, 'b-', label='NaOH')
-        ax.plot(time_points, conc_ea, 'r-', label='Ethyl Acetate')
-        ax.plot(time_points, conc_products, 'g-', label='Products')
-        ax.set_xlabel('Time (minutes)')
-        ax.set_ylabel('Concentration (mol/L)')
-        ax.set_title('Concentration Profiles (mol/L vs minutes)')
-        ax.grid(True, alpha=0.3)
-        ax.legend(frameon=True, fancybox=True, shadow=True)
-        fig.tight_layout()
-        st.pyplot(fig)
+        st.markdown("**Concentration Profiles (mol/L vs minutes)**")
+        st.line_chart(
+            profile_df[['NaOH Concentration (mol/L)',
+                        'Ethyl Acetate Concentration (mol/L)',
+                        'Sodium Acetate Concentration (mol/L)']],
+            x_label='Time (minutes)', y_label='Concentration (mol/L)',
+            color=['#0000FF', '#FF0000', '#008000']
+        )
     
     with tab2:
-        # Conversion plot
-        conversion = (1 - conc_naoh / initial_conc_naoh) * 100
+        # The three tab plots share one frame, built once, instead of a
+        # separate frame per chart
+        kinetics_df = pd.DataFrame({
+            'Time (minutes)': time_points,
+            'Conversion (%)': conversion,
+            'ln(CA/CA0)': np.log(conc_naoh / initial_conc_naoh),
+            '1/CA - 1/CA0': 1/conc_naoh - 1/initial_conc_naoh
+        })
         
-        fig2, ax2 = plt.subplots(figsize=(10, 6), dpi=100)
-        ax2.plot(time_points, conversion, 'b-')
-        ax2.set_xlabel('Time (minutes)')
-        ax2.set_ylabel('Conversion (%)')
-        ax2.set_title('Conversion vs Time (% vs minutes)')
-        ax2.grid(True, alpha=0.3)
-        fig2.tight_layout()
-        st.pyplot(fig2)
+        # Conversion plot
+        st.markdown("**Conversion vs Time (% vs minutes)**")
+        st.line_chart(kinetics_df, x='Time (minutes)', y='Conversion (%)',
+                      x_label='Time (minutes)', y_label='Conversion (%)', color='#0000FF')
         
         # First order kinetic test
-        first_order_test = np.log(conc_naoh / initial_conc_naoh)
-        
-        fig3, ax3 = plt.subplots(figsize=(10, 6), dpi=100)
-        ax3.plot(time_points, first_order_test, 'r-')
-        ax3.set_xlabel('Time (minutes)')
-        ax3.set_ylabel('ln(CA/CA0)')
-        ax3.set_title('First-Order Kinetic Test (ln(CA/CA0) vs minutes)')
-        ax3.grid(True, alpha=0.3)
-        fig3.tight_layout()
-        st.pyplot(fig3)
+        st.markdown("**First-Order Kinetic Test (ln(CA/CA0) vs minutes)**")
+        st.line_chart(kinetics_df, x='Time (minutes)', y='ln(CA/CA0)',
+                      x_label='Time (minutes)', y_label='ln(CA/CA0)', color='#FF0000')
         
         # Second order kinetic test
-        second_order_test = 1/conc_naoh - 1/initial_conc_naoh
-        
-        fig4, ax4 = plt.subplots(figsize=(10, 6), dpi=100)
-        ax4.plot(time_points, second_order_test, 'g-')
-        ax4.set_xlabel('Time (minutes)')
-        ax4.set_ylabel('1/CA - 1/CA0')
-        ax4.set_title('Second-Order Kinetic Test ((1/CA - 1/CA0) vs minutes)')
-        ax4.grid(True, alpha=0.3)
-        fig4.tight_layout()
-        st.pyplot(fig4)
+        st.markdown("**Second-Order Kinetic Test ((1/CA - 1/CA0) vs minutes)**")
+        st.line_chart(kinetics_df, x='Time (minutes)', y='1/CA - 1/CA0',
+                      x_label='Time (minutes)', y_label='1/CA - 1/CA0', color='#008000')
     
     with tab3:
-        # Display data table with selected time points
-        # Sample at regular intervals for clarity, show 20 points instead of 10
-        sample_indices = np.linspace(0, len(time_points)-1, 20).astype(int)
-        st.dataframe(df_display.iloc[sample_indices].reset_index(drop=True))
-        
-        # Download link for full data
-        csv = df_display.to_csv(index=False)
-        st.download_button(
-            "Download Data as CSV",
-            csv,
-            "batch_reactor_data.csv",
-            "text/csv",
-            key='download-csv'
-        )
+        _data_table_tab(initial_conc_naoh, initial_conc_ea, temperature, reaction_time)
     
-    # Temperature effect analysis
-    with st.expander("Temperature Effect Analysis"):
-        st.write("### Effect of Temperature on Reaction Rate Constant")
-        
-        temperatures = [25, 30, 35, 40, 45, 50]
-        temp_kelvin_array = np.array(temperatures) + 273.15
-        k_values = k_ref * np.exp(E_R * (1/308.15 - 1/temp_kelvin_array))
-        
-        temp_df = pd.DataFrame({
-            'Temperature (°C)': temperatures,
-            'Temperature (K)': temp_kelvin_array,
-            'Rate Constant k (L/mol·min)': k_values
-        })
-        
-        st.dataframe(temp_df)
-        
-        # Arrhenius plot
-        fig5, ax5 = plt.subplots(figsize=(10, 6), dpi=100)
-        ax5.plot(1000/temp_kelvin_array, np.log(k_values), 'ro-')
-        ax5.set_xlabel('1000/T (K^-1)')
-        ax5.set_ylabel('ln(k)')
-        ax5.set_title('Arrhenius Plot')
-        ax5.grid(True, alpha=0.3)
-        
-        # Calculate activation energy from slope
-        slope, intercept = np.polyfit(1000/temp_kelvin_array, np.log(k_values), 1)
-        ax5.plot(1000/temp_kelvin_array, slope*(1000/temp_kelvin_array) + intercept, 'b--', 
-                 label=f'Slope = {slope:.2f} → E = {-slope*8.314/1000:.1f} kJ/mol')
-        ax5.legend(frameon=True, fancybox=True, shadow=True)
-        fig5.tight_layout()
-        
-        st.pyplot(fig5)
-        st.write(f"Estimated Activation Energy: {-slope*8.314/1000:.2f} kJ/mol")
+    _temperature_effect_section()
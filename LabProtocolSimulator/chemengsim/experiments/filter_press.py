@@ -1,13 +1,264 @@
+import math
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from utils import set_plot_style
-from scipy.optimize import curve_fit
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy version is used without it
+    njit = None
 
 # Set consistent style for plots
 set_plot_style()
 
+MEDIUM_RESISTANCE = 1e10  # 1/m
+MAX_TIME = 3600           # seconds, 1 hour maximum filtration time
+TEST_TIME = 1800          # seconds, filtration time used for the parameter effect analysis
+
+# Operating points for the parameter effect analysis
+_SWEEP_PRESSURES = np.array([100, 200, 300, 400, 500, 600], dtype=np.float64)    # kPa
+_SWEEP_CONCENTRATIONS = np.array([50, 100, 150, 200, 250, 300], dtype=np.float64)  # kg/m³
+
+def _specific_cake_resistance(filtration_pressure):
+    """Specific cake resistance in m/kg, growing with the square root of pressure (kPa scalar or array)"""
+    return 1e11 * (filtration_pressure / 300)**0.5
+
+# Sweep pressures in Pa and their cake resistances, fixed for every rerun
+_SWEEP_PRESSURES_PA = _SWEEP_PRESSURES * 1000.0
+_SWEEP_CAKE_RESISTANCES = _specific_cake_resistance(_SWEEP_PRESSURES)
+
+def _filtration_curves(time_points, k1, k2):
+    """Filtrate volume, t/V and filtration rate over the time grid for t = k1*V² + k2*V"""
+    # Calculate filtrate volume using quadratic formula
+    # V = (-k2 + sqrt(k2² + 4*k1*t)) / (2*k1)
+    filtrate_volumes = (-k2 + np.sqrt(k2**2 + 4*k1*time_points)) / (2*k1)
+    
+    # Calculate t/V for plotting (left at zero where no filtrate has passed yet)
+    t_over_v = np.divide(time_points, filtrate_volumes,
+                         out=np.zeros_like(time_points), where=filtrate_volumes > 0)
+    
+    # Calculate filtration rate as a backward difference, zero at t = 0
+    filtration_rates = np.empty_like(time_points)
+    filtration_rates[0] = 0.0
+    filtration_rates[1:] = np.diff(filtrate_volumes) / np.diff(time_points)
+    return filtrate_volumes, t_over_v, filtration_rates
+
+if njit is not None:
+    # Compiled eagerly at import for the contiguous float64 grid _simulate
+    # passes, so the first rerun never waits on the JIT
+    @njit("Tuple((float64[::1], float64[::1], float64[::1]))(float64[::1], float64, float64)",
+          cache=True, fastmath=True)
+    def _filtration_curves(time_points, k1, k2):
+        """Single-loop form of the filtration curves, compiled with numba"""
+        n = time_points.size
+        filtrate_volumes = np.empty(n)
+        t_over_v = np.empty(n)
+        filtration_rates = np.empty(n)
+        k2_sq = k2*k2
+        inv_2k1 = 1.0 / (2*k1)
+        prev_t = 0.0
+        prev_v = 0.0
+        for i in range(n):
+            t = time_points[i]
+            v = (-k2 + math.sqrt(k2_sq + 4*k1*t)) * inv_2k1
+            filtrate_volumes[i] = v
+            t_over_v[i] = t / v if v > 0 else 0.0
+            filtration_rates[i] = (v - prev_v) / (t - prev_t) if i > 0 else 0.0
+            prev_t = t
+            prev_v = v
+        return filtrate_volumes, t_over_v, filtration_rates
+
+@st.cache_data(max_entries=64)
+def _simulate(filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness):
+    """Run the constant pressure filtration simulation for one set of sidebar inputs
+    
+    Args:
+        filtration_pressure (float): Filtration pressure (kPa)
+        slurry_concentration (float): Slurry concentration (kg/m³)
+        filter_area (float): Total filter area (m²)
+        filtrate_viscosity (float): Filtrate viscosity (Pa·s)
+        frame_thickness (float): Frame thickness (mm)
+        
+    Returns:
+        tuple: (time_points, filtrate_volumes, t_over_v, filtration_rates, cake_thicknesses_mm,
+            fill_time, fill_time_index, fill_volume, specific_cake_resistance) with the arrays
+            truncated at the fill time if the frames fill up and marked read-only since they
+            are shared between reruns
+    """
+    specific_cake_resistance = np.float64(_specific_cake_resistance(filtration_pressure))  # m/kg, pressure dependent
+    
+    # Generate filtration data on a geometric grid after t = 0, which puts the
+    # samples early on where V, t/V and the rate change fastest
+    time_points = np.concatenate(([0.0], np.geomspace(1.0, MAX_TIME, 99)))
+    
+    # Constants for the filtration equation, coerced once to float64 so the
+    # slider ints never reach the array arithmetic
+    P_Pa = filtration_pressure * 1000.0  # Pa
+    k1 = np.float64((filtrate_viscosity * specific_cake_resistance * slurry_concentration) / (2 * filter_area**2 * P_Pa))
+    k2 = np.float64((filtrate_viscosity * MEDIUM_RESISTANCE) / (filter_area * P_Pa))
+    
+    filtrate_volumes, t_over_v, filtration_rates = _filtration_curves(time_points, k1, k2)
+    
+    # Calculate cake thickness
+    # Cake thickness = Volume of cake / Filter area
+    # Volume of cake = Mass of cake / (Density of cake)
+    # Mass of cake = Concentration * Filtrate volume
+    
+    # Assume cake density is 2.5 times the slurry concentration (dry basis),
+    # so the concentration cancels: thickness = V / (2.5 * A) in m, or
+    # V * 400 / A in mm, applied as a single scale factor
+    cake_thicknesses_mm = filtrate_volumes * (400.0 / filter_area)  # mm
+    
+    # Check if cake thickness exceeds frame thickness
+    max_cake_thickness = frame_thickness  # mm
+    
+    # Find the time when cake fills the frame; the thickness grows monotonically
+    # with time, so a binary search finds the first point at or past the frame
+    fill_time_index = int(np.searchsorted(cake_thicknesses_mm, max_cake_thickness))
+    
+    if 0 < fill_time_index < len(time_points):
+        fill_time = time_points[fill_time_index]
+        fill_volume = filtrate_volumes[fill_time_index]
+    else:
+        # Frames never fill; 0 flags this to the caller
+        fill_time_index = 0
+        fill_time = MAX_TIME
+        fill_volume = filtrate_volumes[-1]
+    
+    # Truncate data at fill time if frame fills up; slicing keeps these as views
+    if fill_time_index > 0:
+        n = fill_time_index + 1
+        time_points = time_points[:n]
+        filtrate_volumes = filtrate_volumes[:n]
+        t_over_v = t_over_v[:n]
+        filtration_rates = filtration_rates[:n]
+        cake_thicknesses_mm = cake_thicknesses_mm[:n]
+    
+    for arr in (time_points, filtrate_volumes, t_over_v, filtration_rates, cake_thicknesses_mm):
+        arr.setflags(write=False)
+    
+    return (time_points, filtrate_volumes, t_over_v, filtration_rates, cake_thicknesses_mm,
+            fill_time, fill_time_index, fill_volume, specific_cake_resistance)
+
+def _results_frame(time_points, filtrate_volumes, t_over_v, filtration_rates, cake_thicknesses_mm):
+    """Wrap the simulated arrays in the results table without copying them"""
+    return pd.DataFrame({
+        'Time (s)': time_points,
+        'Filtrate Volume (m³)': filtrate_volumes,
+        't/V (s/m³)': t_over_v,
+        'Filtration Rate (m³/s)': filtration_rates,
+        'Cake Thickness (mm)': cake_thicknesses_mm
+    }, copy=False)
+
+@st.cache_data(max_entries=64)
+def _csv_bytes(filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness):
+    """Full results table encoded as CSV bytes once per parameter set"""
+    arrays = _simulate(filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness)[:5]
+    return _results_frame(*arrays).to_csv(index=False, lineterminator='\n').encode('utf-8')
+
+@st.cache_data(max_entries=64)
+def _ruth_fit(filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness):
+    """Straight-line fit of t/V against V for the simulated run
+    
+    Returns:
+        tuple: (slope, intercept) of the Ruth plot
+    """
+    filtrate_volumes, t_over_v = _simulate(
+        filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness
+    )[1:3]
+    mask = filtrate_volumes > 0
+    
+    # t/V is linear in V, so an ordinary least-squares line is all the fit needs
+    slope, intercept = np.polyfit(filtrate_volumes[mask], t_over_v[mask], 1)
+    return slope, intercept
+
+@st.cache_data(max_entries=64)
+def _pressure_sweep(filtrate_viscosity, slurry_concentration, filter_area, test_time):
+    """Filtrate volume after test_time seconds over a range of filtration pressures
+    
+    Returns:
+        tuple: (pressures in kPa, final filtrate volumes in m³) as arrays
+    """
+    # Recalculate constants for every pressure at once; cake resistance is pressure dependent
+    k1_p = (filtrate_viscosity * _SWEEP_CAKE_RESISTANCES * slurry_concentration) / (2 * filter_area**2 * _SWEEP_PRESSURES_PA)
+    k2_p = (filtrate_viscosity * MEDIUM_RESISTANCE) / (filter_area * _SWEEP_PRESSURES_PA)
+    
+    # Calculate final volume after the specified time
+    final_volumes = (-k2_p + np.sqrt(k2_p**2 + 4*k1_p*test_time)) / (2*k1_p)
+    return _SWEEP_PRESSURES, final_volumes
+
+@st.cache_data(max_entries=64)
+def _concentration_sweep(filtrate_viscosity, filtration_pressure, filter_area, test_time):
+    """Filtrate volume after test_time seconds over a range of slurry concentrations
+    
+    Returns:
+        tuple: (concentrations in kg/m³, final filtrate volumes in m³) as arrays
+    """
+    # Only k1 depends on the concentration; k2 is the same scalar for every point
+    P_Pa = filtration_pressure * 1000.0  # Pa
+    k1_c = (filtrate_viscosity * _specific_cake_resistance(filtration_pressure) * _SWEEP_CONCENTRATIONS) / (2 * filter_area**2 * P_Pa)
+    k2_c = (filtrate_viscosity * MEDIUM_RESISTANCE) / (filter_area * P_Pa)
+    
+    # Calculate final volume after the specified time
+    final_volumes_conc = (-k2_c + np.sqrt(k2_c**2 + 4*k1_c*test_time)) / (2*k1_c)
+    return _SWEEP_CONCENTRATIONS, final_volumes_conc
+
+# Figures are rasterized at screen resolution; st.pyplot scales them to the
+# container width anyway, so a higher DPI only inflates the PNG sent over
+FIGURE_DPI = 72
+
+# Keyword arguments for each of the page's figures
+_FIGURE_KWARGS = {
+    'filtration': dict(figsize=(10, 6), dpi=FIGURE_DPI),
+    'rate': dict(figsize=(10, 6), dpi=FIGURE_DPI),
+    'cake': dict(figsize=(10, 6), dpi=FIGURE_DPI),
+    'porosity': dict(figsize=(10, 6), dpi=FIGURE_DPI),
+    'ruth': dict(figsize=(10, 6), dpi=FIGURE_DPI),
+    'pressure_sweep': dict(figsize=(8, 5), dpi=FIGURE_DPI),
+    'concentration_sweep': dict(figsize=(8, 5), dpi=FIGURE_DPI)
+}
+
+def _figure(name, x=None, y=None, fmt=None):
+    """Figure and axes for one of the page's plots with its data line drawn
+    
+    Each session keeps its figures in session state and reuses them across
+    reruns rather than building new ones every time. They are plain Figure
+    objects, so pyplot never tracks (or leaks) them. The data line is plotted
+    once per session; later reruns move it onto the new data with set_data and
+    only remove the overlays (marker lines, fits, text, legend) drawn around it.
+    
+    Args:
+        name (str): Key of the plot in _FIGURE_KWARGS
+        x, y (array-like): Data for the plot's main line; plots drawn entirely
+            from overlays leave them out
+        fmt (str): Matplotlib format string for the main line
+    """
+    if 'filter_press_figs' not in st.session_state:
+        st.session_state.filter_press_figs = {}
+    figs = st.session_state.filter_press_figs
+    
+    if name not in figs:
+        fig = Figure(**_FIGURE_KWARGS[name])
+        ax = fig.add_subplot()
+        line = ax.plot(x, y, fmt)[0] if x is not None else None
+        figs[name] = (fig, ax, line)
+        return fig, ax
+    
+    fig, ax, line = figs[name]
+    for artist in [*ax.lines, *ax.texts, *ax.collections]:
+        if artist is not line:
+            artist.remove()
+    if ax.get_legend() is not None:
+        ax.get_legend().remove()
+    
+    if line is not None:
+        line.set_data(x, y)
+    ax.relim()
+    ax.autoscale_view()
+    return fig, ax
+
 def app():
     st.title("Experiment 6: Plate and Frame Filter Press")
     
@@ -85,76 +336,12 @@ def app():
     total_frame_volume = frame_volume * num_plates  # m³
     
     # Assumed or calculated parameters
-    specific_cake_resistance = 1e11 * (filtration_pressure / 300)**0.5  # m/kg, pressure dependent
-    medium_resistance = 1e10  # 1/m
-    
-    # Generate filtration data
-    max_time = 3600  # seconds, 1 hour maximum filtration time
-    time_points = np.linspace(0, max_time, 100)
-    
-    # Constants for the filtration equation
-    k1 = (filtrate_viscosity * specific_cake_resistance * slurry_concentration) / (2 * filter_area**2 * (filtration_pressure * 1000))
-    k2 = (filtrate_viscosity * medium_resistance) / (filter_area * (filtration_pressure * 1000))
-    
-    # Calculate filtrate volume using quadratic formula
-    # t = k1*V² + k2*V
-    # V = (-k2 + sqrt(k2² + 4*k1*t)) / (2*k1)
-    filtrate_volumes = np.zeros_like(time_points)
-    
-    for i, t in enumerate(time_points):
-        if t > 0:
-            filtrate_volumes[i] = (-k2 + np.sqrt(k2**2 + 4*k1*t)) / (2*k1)
-    
-    # Calculate t/V for plotting
-    t_over_v = np.zeros_like(time_points)
-    for i, (t, v) in enumerate(zip(time_points, filtrate_volumes)):
-        if v > 0:
-            t_over_v[i] = t / v
-    
-    # Calculate filtration rate
-    filtration_rates = np.zeros_like(time_points)
-    for i in range(1, len(time_points)):
-        dt = time_points[i] - time_points[i-1]
-        dv = filtrate_volumes[i] - filtrate_volumes[i-1]
-        if dt > 0:
-            filtration_rates[i] = dv / dt
-    
-    # Calculate cake thickness
-    # Cake thickness = Volume of cake / Filter area
-    # Volume of cake = Mass of cake / (Density of cake)
-    # Mass of cake = Concentration * Filtrate volume
-    
-    # Assume cake density is 2.5 times the slurry concentration (dry basis)
-    cake_density = 2.5 * slurry_concentration  # kg/m³
-    
-    cake_thicknesses = slurry_concentration * filtrate_volumes / (cake_density * filter_area)  # m
-    cake_thicknesses_mm = cake_thicknesses * 1000  # mm
-    
-    # Check if cake thickness exceeds frame thickness
-    max_cake_thickness = frame_thickness  # mm
-    
-    # Find the time when cake fills the frame
-    fill_time_index = np.argmax(cake_thicknesses_mm >= max_cake_thickness)
+    medium_resistance = MEDIUM_RESISTANCE  # 1/m
     
-    if fill_time_index > 0:
-        fill_time = time_points[fill_time_index]
-        fill_volume = filtrate_volumes[fill_time_index]
-    else:
-        fill_time = max_time
-        fill_volume = filtrate_volumes[-1]
-    
-    # Create dataframe for results
-    df = pd.DataFrame({
-        'Time (s)': time_points,
-        'Filtrate Volume (m³)': filtrate_volumes,
-        't/V (s/m³)': t_over_v,
-        'Filtration Rate (m³/s)': filtration_rates,
-        'Cake Thickness (mm)': cake_thicknesses_mm
-    })
-    
-    # Truncate data at fill time if frame fills up
-    if fill_time_index > 0:
-        df = df.iloc[:fill_time_index+1].copy()
+    (time_points, filtrate_volumes, t_over_v, filtration_rates, cake_thicknesses_mm,
+     fill_time, fill_time_index, fill_volume, specific_cake_resistance) = _simulate(
+        filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness
+    )
     
     # Main experiment area
     st.header("Simulation Results")
@@ -177,15 +364,14 @@ def app():
             st.write(f"**Final filtrate volume:** {fill_volume:.4f} m³")
         else:
             st.write("**Frames do not fill completely in the given time**")
-            st.write(f"**Final filtrate volume:** {filtrate_volumes[-1]:.4f} m³")
+            st.write(f"**Final filtrate volume:** {fill_volume:.4f} m³")
     
     # Create tabs for different displays
     tab1, tab2, tab3, tab4 = st.tabs(["Filtration Curve", "Cake Formation", "Ruth Plot", "Data Table"])
     
     with tab1:
         # Filtration curve
-        fig, ax = plt.subplots(figsize=(10, 6), dpi=100)
-        ax.plot(time_points[:len(df)], df['Filtrate Volume (m³)'], 'b-')
+        fig, ax = _figure('filtration', time_points, filtrate_volumes, 'b-')
         
         if fill_time_index > 0:
             ax.axvline(x=fill_time, color='r', linestyle='--', 
@@ -201,8 +387,7 @@ def app():
         st.pyplot(fig)
         
         # Filtration rate
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-        ax2.plot(time_points[:len(df)], df['Filtration Rate (m³/s)'], 'g-')
+        fig2, ax2 = _figure('rate', time_points, filtration_rates, 'g-')
         
         if fill_time_index > 0:
             ax2.axvline(x=fill_time, color='r', linestyle='--', 
@@ -219,8 +404,7 @@ def app():
     
     with tab2:
         # Cake formation
-        fig3, ax3 = plt.subplots(figsize=(10, 6))
-        ax3.plot(time_points[:len(df)], df['Cake Thickness (mm)'], 'b-')
+        fig3, ax3 = _figure('cake', time_points, cake_thicknesses_mm, 'b-')
         
         if fill_time_index > 0:
             ax3.axvline(x=fill_time, color='r', linestyle='--', 
@@ -245,10 +429,13 @@ def app():
         porosity_factor = 0.5 + 0.5 * (300 / filtration_pressure)
         final_porosity = initial_porosity * porosity_factor
         
-        porosities = np.linspace(initial_porosity, final_porosity, len(df))
-        
-        fig4, ax4 = plt.subplots(figsize=(10, 6))
-        ax4.plot(time_points[:len(df)], porosities, 'r-')
+        # The porosity falls linearly over the run, so an axline through its two
+        # endpoints draws it without any data array; the endpoints alone set the limits
+        start, end = (time_points[0], initial_porosity), (time_points[-1], final_porosity)
+        fig4, ax4 = _figure('porosity')
+        ax4.axline(start, end, color='r')
+        ax4.update_datalim([start, end])
+        ax4.autoscale_view()
         
         ax4.set_xlabel('Time (s)')
         ax4.set_ylabel('Estimated Cake Porosity')
@@ -260,31 +447,29 @@ def app():
     with tab3:
         # Ruth plot (t/V vs V)
         # Filter out zeros to avoid division issues
-        mask = df['Filtrate Volume (m³)'] > 0
-        ruth_volumes = df.loc[mask, 'Filtrate Volume (m³)']
-        ruth_t_over_v = df.loc[mask, 't/V (s/m³)']
+        mask = filtrate_volumes > 0
+        ruth_volumes = filtrate_volumes[mask]
+        ruth_t_over_v = t_over_v[mask]
         
-        fig5, ax5 = plt.subplots(figsize=(10, 6))
-        ax5.plot(ruth_volumes, ruth_t_over_v, 'b.')
+        fig5, ax5 = _figure('ruth', ruth_volumes, ruth_t_over_v, 'b.')
         
         # Fit a linear model
         if len(ruth_volumes) > 2:
-            # Fit a straight line to the data
-            def linear_func(x, a, b):
-                return a * x + b
-            
-            popt, pcov = curve_fit(linear_func, ruth_volumes, ruth_t_over_v)
-            slope, intercept = popt
+            # Fit a straight line to the data (cached alongside the simulation)
+            slope, intercept = _ruth_fit(
+                filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness
+            )
             
             # Calculate fitted line
-            fit_line = linear_func(ruth_volumes, slope, intercept)
+            fit_line = slope * ruth_volumes + intercept
             
             # Plot the fitted line
             ax5.plot(ruth_volumes, fit_line, 'r-', label=f'Fit: y = {slope:.2e}x + {intercept:.2e}')
             
             # Calculate specific cake resistance and medium resistance from the fit
-            calculated_alpha = 2 * slope * filter_area**2 * (filtration_pressure * 1000) / (filtrate_viscosity * slurry_concentration)
-            calculated_rm = intercept * filter_area * (filtration_pressure * 1000) / filtrate_viscosity
+            P_Pa = filtration_pressure * 1000.0  # Pa
+            calculated_alpha = 2 * slope * filter_area**2 * P_Pa / (filtrate_viscosity * slurry_concentration)
+            calculated_rm = intercept * filter_area * P_Pa / filtrate_viscosity
             
             ax5.text(0.05, 0.9, f"Specific cake resistance: {calculated_alpha:.2e} m/kg", 
                     transform=ax5.transAxes, fontsize=10)
@@ -301,16 +486,19 @@ def app():
         st.pyplot(fig5)
     
     with tab4:
+        # The table is only needed here, so the arrays are wrapped in a DataFrame just for it
+        df = _results_frame(time_points, filtrate_volumes, t_over_v, filtration_rates, cake_thicknesses_mm)
+        
         # Display data table with selected points
-        # Sample at regular intervals for clarity
-        sample_indices = np.linspace(0, len(df)-1, min(20, len(df))).astype(int)
-        st.dataframe(df.iloc[sample_indices].reset_index(drop=True))
+        # Sample at regular intervals for clarity; short runs are shown whole
+        if len(df) > 20:
+            df = df.iloc[np.linspace(0, len(df)-1, 20, dtype=np.intp)]
+        st.dataframe(df, hide_index=True)
         
         # Download link for full data
-        csv = df.to_csv(index=False)
         st.download_button(
             "Download Data as CSV",
-            csv,
+            _csv_bytes(filtration_pressure, slurry_concentration, filter_area, filtrate_viscosity, frame_thickness),
             "filter_press_data.csv",
             "text/csv",
             key='download-csv'
@@ -321,7 +509,7 @@ def app():
         st.write("### Effect of Process Parameters on Filtration Performance")
         
         # Define test time outside of columns to make it accessible to both
-        test_time = 1800  # Time in seconds for parameter effect analysis
+        test_time = TEST_TIME  # Time in seconds for parameter effect analysis
         
         col1, col2 = st.columns(2)
         
@@ -329,21 +517,11 @@ def app():
             # Effect of pressure
             st.write("**Effect of Pressure on Filtration Rate**")
             
-            pressures = [100, 200, 300, 400, 500, 600]
-            final_volumes = []
+            pressures, final_volumes = _pressure_sweep(
+                filtrate_viscosity, slurry_concentration, filter_area, test_time
+            )
             
-            for p in pressures:
-                # Recalculate constants
-                specific_cake_resistance_p = 1e11 * (p / 300)**0.5  # Pressure dependent
-                k1_p = (filtrate_viscosity * specific_cake_resistance_p * slurry_concentration) / (2 * filter_area**2 * (p * 1000))
-                k2_p = (filtrate_viscosity * medium_resistance) / (filter_area * (p * 1000))
-                
-                # Calculate final volume after the specified time
-                final_volume_p = (-k2_p + np.sqrt(k2_p**2 + 4*k1_p*test_time)) / (2*k1_p)
-                final_volumes.append(final_volume_p)
-            
-            fig6, ax6 = plt.subplots(figsize=(8, 5))
-            ax6.plot(pressures, final_volumes, 'bo-')
+            fig6, ax6 = _figure('pressure_sweep', pressures, final_volumes, 'bo-')
             ax6.axvline(x=filtration_pressure, color='r', linestyle='--', 
                        label=f'Current: {filtration_pressure} kPa')
             
@@ -359,20 +537,11 @@ def app():
             # Effect of slurry concentration
             st.write("**Effect of Slurry Concentration on Filtration Rate**")
             
-            concentrations = [50, 100, 150, 200, 250, 300]
-            final_volumes_conc = []
-            
-            for c in concentrations:
-                # Recalculate constants
-                k1_c = (filtrate_viscosity * specific_cake_resistance * c) / (2 * filter_area**2 * (filtration_pressure * 1000))
-                k2_c = (filtrate_viscosity * medium_resistance) / (filter_area * (filtration_pressure * 1000))
-                
-                # Calculate final volume after the specified time
-                final_volume_c = (-k2_c + np.sqrt(k2_c**2 + 4*k1_c*test_time)) / (2*k1_c)
-                final_volumes_conc.append(final_volume_c)
+            concentrations, final_volumes_conc = _concentration_sweep(
+                filtrate_viscosity, filtration_pressure, filter_area, test_time
+            )
             
-            fig7, ax7 = plt.subplots(figsize=(8, 5))
-            ax7.plot(concentrations, final_volumes_conc, 'go-')
+            fig7, ax7 = _figure('concentration_sweep', concentrations, final_volumes_conc, 'go-')
             ax7.axvline(x=slurry_concentration, color='r', linestyle='--', 
                        label=f'Current: {slurry_concentration} kg/m³')
             
@@ -3,7 +3,6 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from utils import set_plot_style
-from scipy.optimize import curve_fit
 
 # Set consistent style for plots
 set_plot_style()
@@ -8,10 +8,11 @@ Module for generating reports for Froth Flotation experiments.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from .report_generator import ReportGenerator
+from .report_utils import new_figure
 import plotly.graph_objects as go
 
+@st.cache_data
 def calculate_coal_recovery(data):
     """Calculate coal recovery metrics"""
     # Copy original data
@@ -59,7 +60,8 @@ def generate_matplotlib_plot(results):
     pine_oil_values = pd.to_numeric(results['Pine Oil (ml)'], errors='coerce')
     
     # Plot: Pine Oil vs Coal Recovery
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig = new_figure((8, 5))
+    ax = fig.axes[0]
     ax.plot(pine_oil_values, results['% recovery of coal'], 'o-', color='blue')
     ax.set_xlabel('Pine Oil Concentration (ml)')
     ax.set_ylabel('Coal Recovery (%)')
@@ -123,12 +125,10 @@ def create_froth_flotation_form():
     if edited_df is not None:
         st.session_state.flotation_data = edited_df
     
-    generate_report = st.button("Generate Report", key="froth_flotation_generate_report")
-    
-    if generate_report:
-        if not student_name or not student_id:
-            st.error("Please enter your name and ID before generating the report.")
-            return
+    # Only re-validate the observations when the table contents actually change
+    data_hash = pd.util.hash_pandas_object(edited_df, index=False).values.tobytes()
+    if st.session_state.get('_flot_hash') != data_hash:
+        st.session_state['_flot_hash'] = data_hash
         
         # Check if all required data is entered
         required_cols = [
@@ -141,7 +141,16 @@ def create_froth_flotation_form():
                 missing_data = True
                 break
         
-        if missing_data:
+        st.session_state['_flot_missing_data'] = missing_data
+    
+    generate_report = st.button("Generate Report", key="froth_flotation_generate_report")
+    
+    if generate_report:
+        if not student_name or not student_id:
+            st.error("Please enter your name and ID before generating the report.")
+            return
+        
+        if st.session_state['_flot_missing_data']:
             st.error("Please fill in all observation data before generating the report.")
             return
         
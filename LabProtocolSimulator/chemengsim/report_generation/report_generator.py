@@ -208,13 +208,6 @@ class ReportGenerator:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{self.experiment_name}_report_{timestamp}.docx"
         
-        # Generate download link
-        download_link = report_utils.generate_report_download_link(self.document, filename)
-        
-        # Display download link
-        st.markdown(download_link, unsafe_allow_html=True)
-        
-        # Also provide the standard Streamlit download option
         # Save to a bytes buffer
         buffer = io.BytesIO()
         self.document.save(buffer)
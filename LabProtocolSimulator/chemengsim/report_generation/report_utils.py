@@ -8,7 +8,8 @@ Helper functions for creating reports from lab observation data.
 import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import io
 import base64
 from docxtpl import DocxTemplate
@@ -77,9 +78,22 @@ def insert_plotly_figure(fig, document, width=6, height=4):
     if os.path.exists(img_path):
         os.remove(img_path)
 
+def new_figure(figsize):
+    """Return a fresh single-axes Figure backed by an Agg canvas
+    
+    Built with the OO API so the figure never enters pyplot's global registry;
+    each call gets its own Figure, so concurrent sessions never draw on a
+    shared one.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    fig.add_subplot(111)
+    return fig
+
 def create_matplotlib_graph(x_data, y_data, title, xlabel, ylabel, legend=None):
     """Create a matplotlib graph from data"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = new_figure((10, 6))
+    ax = fig.axes[0]
     
     if isinstance(y_data[0], list):
         for i, y in enumerate(y_data):
@@ -150,53 +164,3 @@ def add_experiment_metadata(document, title, student_name, student_id, date=None
     
     # Add separator
     document.add_paragraph("_" * 50)
-
-def create_download_link(file_content, file_name, text="Download File"):
-    """
-    Creates a download link for any file content.
-    
-    Parameters:
-    -----------
-    file_content : bytes
-        Binary content of the file to be downloaded
-    file_name : str
-        Name of the file to be downloaded
-    text : str
-        Text to display for the download link
-        
-    Returns:
-    --------
-    str
-        HTML string containing the download link
-    """
-    b64 = base64.b64encode(file_content).decode()
-    href = f'<a href="data:application/octet-stream;base64,{b64}" download="{file_name}">{text}</a>'
-    return href
-
-def generate_report_download_link(document, filename=None):
-    """
-    Generates a download link for a Word document.
-    
-    Parameters:
-    -----------
-    document : Document
-        The python-docx Document object
-    filename : str, optional
-        Name of the file to be downloaded. If None, a default name is used.
-        
-    Returns:
-    --------
-    str
-        HTML string containing the download link
-    """
-    if filename is None:
-        filename = f"lab_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
-        
-    # Save document to a bytes stream
-    file_stream = io.BytesIO()
-    document.save(file_stream)
-    file_stream.seek(0)
-    
-    # Create download link
-    file_bytes = file_stream.read()
-    return create_download_link(file_bytes, filename, "Download Report (DOCX)")
\ No newline at end of file
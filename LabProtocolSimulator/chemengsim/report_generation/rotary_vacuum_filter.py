@@ -8,85 +8,118 @@ Module for generating reports for Rotary Vacuum Filter experiments.
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from .report_generator import ReportGenerator
-import plotly.graph_objects as go
-from scipy.stats import linregress
 
-def calculate_specific_cake_resistance(data, vacuum_pressure, area, viscosity):
-    """Calculate specific cake resistance and filter medium resistance"""
-    # Copy data and ensure numeric values
-    df = data.copy()
-    
-    # Convert all values to numeric
-    for col in df.columns:
-        if col in ['Time (s)', 'Liquid level in the filtrate tank (cm)']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy version is used without it
+    njit = None
+
+def _cake_resistance_core(t, level, tank_area, area, pressure_pa, viscosity, c):
+    """Array core of the cake resistance calculation
     
+    Returns (V, t/V, slope, intercept, alpha, r_m) for float64 time and level arrays.
+    The fit is the closed-form equivalent of np.polyfit(V, t/V, 1); only slope and
+    intercept are needed, so scipy.stats.linregress and its extra statistics are not used.
+    """
     # Calculate V (volume in m³)
-    tank_area = 0.0005  # m² (example value, adjust as needed)
-    df['V'] = df['Liquid level in the filtrate tank (cm)'] * 0.01 * tank_area  # Convert cm to m and multiply by area
+    V = level * (0.01 * tank_area)  # Convert cm to m and multiply by area
     
     # Calculate t/V
-    df['t/V'] = df['Time (s)'] / df['V']
+    tV = t / V
     
-    # Linear regression to find slope and intercept
-    slope, intercept, r_value, p_value, std_err = linregress(df['V'], df['t/V'])
+    # Least-squares fit of t/V against V (only slope and intercept are needed)
+    mean_V = V.mean()
+    mean_tV = tV.mean()
+    vx = V - mean_V
+    slope = (vx * (tV - mean_tV)).sum() / (vx * vx).sum()
+    intercept = mean_tV - slope * mean_V
     
     # Calculate specific cake resistance
-    pressure_pa = vacuum_pressure * 133.322  # Convert mmHg to Pa
-    c = 0.1  # kg/m³ (slurry concentration, adjust as needed)
-    
-    alpha = 2 * area**2 * slope * pressure_pa / (viscosity * c)
+    alpha = 2 * area * area * slope * pressure_pa / (viscosity * c)
     
     # Calculate filter medium resistance
     r_m = intercept * area * pressure_pa / viscosity
     
-    return df, alpha, r_m, slope, intercept
+    return V, tV, slope, intercept, alpha, r_m
 
-def generate_vacuum_filter_plots(df):
-    """Generate plots for vacuum filter experiment"""
-    # Plot: V vs t/V
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df['V'],
-        y=df['t/V'],
-        mode='markers',
-        name='Experimental Data'
-    ))
+if njit is not None:
+    _cake_resistance_core = njit(cache=True)(_cake_resistance_core)
+
+def calculate_specific_cake_resistance(data, pressure_pa, area, viscosity, c):
+    """Calculate specific cake resistance and filter medium resistance
     
-    # Add linear regression line
-    slope, intercept, r_value, p_value, std_err = linregress(df['V'], df['t/V'])
+    pressure_pa is the vacuum pressure in Pa and c the slurry concentration
+    as a mass fraction; both are converted once by the caller.
+    """
+    # Extract the two observation columns as float arrays
+    t = pd.to_numeric(data['Time (s)'], errors='coerce').to_numpy(dtype=np.float64)
+    level = pd.to_numeric(data['Liquid level in the filtrate tank (cm)'], errors='coerce').to_numpy(dtype=np.float64)
+    
+    tank_area = 0.0005  # m² (example value, adjust as needed)
+    V, tV, slope, intercept, alpha, r_m = _cake_resistance_core(
+        t, level, tank_area, float(area), float(pressure_pa), float(viscosity), float(c)
+    )
     
-    x_range = np.linspace(min(df['V']), max(df['V']), 100)
+    df = pd.DataFrame({
+        'Time (s)': t,
+        'Liquid level in the filtrate tank (cm)': level,
+        'V': V,
+        't/V': tV
+    }, index=data.index)
+    
+    return df, alpha, r_m, slope, intercept
+
+def generate_vacuum_filter_plots(df, slope, intercept):
+    """Generate plots for vacuum filter experiment
+    
+    Returns a plain Plotly figure spec, which st.plotly_chart accepts directly
+    without building graph_objects traces one at a time.
+    """
+    # Linear regression line
+    x_range = np.array([df['V'].min(), df['V'].max()], dtype=float)  # Two points define the line
     y_range = slope * x_range + intercept
     
-    fig.add_trace(go.Scatter(
-        x=x_range,
-        y=y_range,
-        mode='lines',
-        name=f'Linear Fit (y = {slope:.2e}x + {intercept:.2e})',
-        line=dict(dash='dash')
-    ))
-    
-    fig.update_layout(
-        title='Plot of t/V vs V',
-        xaxis_title='Volume of Filtrate, V (m³)',
-        yaxis_title='t/V (s/m³)',
-        template='plotly_white'
-    )
+    # Plot: V vs t/V
+    fig = {
+        'data': [
+            {
+                'type': 'scatter',
+                'x': df['V'].tolist(),
+                'y': df['t/V'].tolist(),
+                'mode': 'markers',
+                'name': 'Experimental Data'
+            },
+            {
+                'type': 'scatter',
+                'x': x_range.tolist(),
+                'y': y_range.tolist(),
+                'mode': 'lines',
+                'name': f'Linear Fit (y = {slope:.2e}x + {intercept:.2e})',
+                'line': {'dash': 'dash'}
+            }
+        ],
+        'layout': {
+            'title': {'text': 'Plot of t/V vs V'},
+            'xaxis': {'title': {'text': 'Volume of Filtrate, V (m³)'}},
+            'yaxis': {'title': {'text': 't/V (s/m³)'}},
+            'template': 'plotly_white'
+        }
+    }
     
-    return fig, slope, intercept
+    return fig
 
 def generate_matplotlib_plot(df, slope, intercept):
     """Generate matplotlib plot for document embedding"""
+    import matplotlib.pyplot as plt
+    
     fig, ax = plt.subplots(figsize=(8, 5))
     
     # Plot experimental data
     ax.scatter(df['V'], df['t/V'], label='Experimental Data')
     
     # Add linear regression line
-    x_range = np.linspace(min(df['V']), max(df['V']), 100)
+    x_range = np.array([df['V'].min(), df['V'].max()], dtype=float)  # Two points define the line
     y_range = slope * x_range + intercept
     
     ax.plot(x_range, y_range, 'r--', label=f'Linear Fit (y = {slope:.2e}x + {intercept:.2e})')
@@ -99,6 +132,24 @@ def generate_matplotlib_plot(df, slope, intercept):
     
     return fig
 
+@st.cache_data
+def default_observation_data(vacuum_pressure):
+    """Build the default observation table for the given vacuum pressure"""
+    time_values = [15, 33, 54, 69, 91, 108, 128, 152, 174, 206] if vacuum_pressure == 200 else [8, 15, 27, 35, 41, 51, 59, 70, 78, 89]
+    level_values = list(range(1, 11))
+    
+    return pd.DataFrame({
+        'Time (s)': time_values,
+        'Liquid level in the filtrate tank (cm)': level_values,
+        'Weight (g) Wet Cake': [''] * 10,
+        'Weight (g) Dry Cake': [''] * 10
+    })
+
+@st.cache_data
+def calculate_filter_area(drum_dia, drum_length):
+    """Calculate the drum filter area in m² from diameter and length in mm"""
+    return np.pi * (drum_dia/1000) * (drum_length/1000)  # Convert mm to m
+
 def create_rotary_vacuum_filter_form():
     """Create input form for rotary vacuum filter experiment"""
     st.title("Rotary Vacuum Filter Experiment")
@@ -125,7 +176,7 @@ def create_rotary_vacuum_filter_form():
     viscosity = st.number_input("Viscosity (kg/m·s)", value=0.001, format="%.4f")
     
     # Calculate area
-    area = np.pi * (drum_dia/1000) * (drum_length/1000)  # Convert mm to m
+    area = calculate_filter_area(drum_dia, drum_length)
     st.write(f"Calculated Filter Area: {area:.4f} m²")
     
     # Student information
@@ -143,35 +194,30 @@ def create_rotary_vacuum_filter_form():
     
     # Observation data
     st.subheader("Observation Data")
-    st.markdown("Enter the observations from your experiment:")
     
     # Initialize or get session state
     session_key = f"vacuum_filter_data_{vacuum_pressure}"
     if session_key not in st.session_state:
-        # Default empty dataframe with 10 rows
-        time_values = [15, 33, 54, 69, 91, 108, 128, 152, 174, 206] if vacuum_pressure == 200 else [8, 15, 27, 35, 41, 51, 59, 70, 78, 89]
-        level_values = list(range(1, 11))
+        # Default dataframe with 10 rows
+        st.session_state[session_key] = default_observation_data(vacuum_pressure).copy()
+    
+    # Batch table edits in a form so cell changes don't rerun the page until submit
+    with st.form("vacuum_filter_form", clear_on_submit=False):
+        st.markdown("Enter the observations from your experiment:")
         
-        st.session_state[session_key] = pd.DataFrame({
-            'Time (s)': time_values,
-            'Liquid level in the filtrate tank (cm)': level_values,
-            'Weight (g) Wet Cake': [''] * 10,
-            'Weight (g) Dry Cake': [''] * 10
-        })
-    
-    # Create a copy to edit
-    edited_df = st.data_editor(
-        st.session_state[session_key],
-        use_container_width=True,
-        num_rows="dynamic"
-    )
+        # Create a copy to edit
+        edited_df = st.data_editor(
+            st.session_state[session_key],
+            use_container_width=True,
+            num_rows="dynamic"
+        )
+        
+        generate_report = st.form_submit_button("Generate Report")
     
     # Update session state when changes are made
     if edited_df is not None:
         st.session_state[session_key] = edited_df
     
-    generate_report = st.button("Generate Report", key="vacuum_filter_generate_report")
-    
     if generate_report:
         if not student_name or not student_id:
             st.error("Please enter your name and ID before generating the report.")
@@ -180,28 +226,30 @@ def create_rotary_vacuum_filter_form():
         # Check if all required data is entered
         required_cols = ['Time (s)', 'Liquid level in the filtrate tank (cm)']
         
-        missing_data = False
-        for col in required_cols:
-            if edited_df[col].isna().any() or (edited_df[col] == '').any():
-                missing_data = True
-                break
+        required_values = edited_df[required_cols].to_numpy(dtype=object)
+        missing_data = pd.isna(required_values).any() or (required_values == '').any()
         
         if missing_data:
             st.error("Please fill in all observation data before generating the report.")
             return
         
+        # Convert inputs to SI once for both the calculation and the report text
+        pressure_pa = vacuum_pressure * 133.322  # Convert mmHg to Pa
+        c_frac = slurry_conc / 100.0  # Slurry concentration as a fraction
+        
         # Generate report
         with st.spinner("Generating report..."):
             # Perform calculations
             results, alpha, r_m, slope, intercept = calculate_specific_cake_resistance(
                 edited_df, 
-                vacuum_pressure,
+                pressure_pa,
                 area,
-                viscosity
+                viscosity,
+                c_frac
             )
             
             # Create interactive plotly plot for display
-            fig, slope, intercept = generate_vacuum_filter_plots(results)
+            fig = generate_vacuum_filter_plots(results, slope, intercept)
             
             # Create matplotlib plot for document
             doc_fig = generate_matplotlib_plot(results, slope, intercept)
@@ -280,11 +328,11 @@ def create_rotary_vacuum_filter_form():
                 f"Calculation of α and R_m using the equation and the constant parameters.\n\n"
                 f"Specific Cake Resistance:\n"
                 f"α = 2 * A² * slope * ΔP / (μ * c)\n"
-                f"α = 2 * ({area:.4f})² * {slope:.2e} * ({vacuum_pressure * 133.322:.2f}) / ({viscosity} * {slurry_conc/100})\n"
+                f"α = 2 * ({area:.4f})² * {slope:.2e} * ({pressure_pa:.2f}) / ({viscosity} * {c_frac})\n"
                 f"α = {alpha:.2e} m/kg\n\n"
                 f"Filter Medium Resistance:\n"
                 f"R_m = intercept * A * ΔP / μ\n"
-                f"R_m = {intercept:.2e} * {area:.4f} * {vacuum_pressure * 133.322:.2f} / {viscosity}\n"
+                f"R_m = {intercept:.2e} * {area:.4f} * {pressure_pa:.2f} / {viscosity}\n"
                 f"R_m = {r_m:.2e} m⁻¹"
             ]
             report.add_calculations("", sample_calcs)
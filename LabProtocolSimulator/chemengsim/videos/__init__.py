@@ -5,7 +5,12 @@ Videos Module
 This module contains the video demonstration functionality for the Chemical Engineering Lab Simulator.
 """
 
-from . import demo_videos
-from . import create_videos
-from . import create_placeholders
-from . import create_simple_videos
\ No newline at end of file
+import importlib
+
+__all__ = ["demo_videos", "create_videos", "create_placeholders", "create_simple_videos"]
+
+def __getattr__(name):
+    """Import submodules on first access so the package doesn't pull in matplotlib at startup"""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,42 @@
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 import os
+import io
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
 
-def create_placeholder_image(title, filename, size=(640, 360)):
+# Figure axis reused by every placeholder rendered in the current process
+_worker_ax = None
+
+# PNG buffer reused by every placeholder rendered in the current process
+_png_buffer = io.BytesIO()
+
+def _new_placeholder_figure(size=(640, 360)):
+    """Create a single-axis figure on an Agg canvas, bypassing pyplot's figure manager"""
+    fig = Figure(figsize=(size[0]/100, size[1]/100), dpi=100)
+    FigureCanvasAgg(fig)
+    fig.add_subplot(111)
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+    return fig
+
+def create_placeholder_image(title, filename, size=(640, 360), ax=None):
     """Create a placeholder image with the given title
     
     Args:
         title (str): The title to display on the image
         filename (str): The filename to save the image to
         size (tuple): The size of the image in pixels
+        ax (matplotlib.axes.Axes, optional): Existing axis to draw on. It is
+            cleared and reused so a batch of placeholders shares one figure.
     """
-    # Create figure and axis
-    fig, ax = plt.subplots(figsize=(size[0]/100, size[1]/100), dpi=100)
+    if ax is None:
+        # Create figure and axis
+        fig = _new_placeholder_figure(size)
+        ax = fig.axes[0]
+    else:
+        fig = ax.figure
+        ax.clear()
     
     # Set background color
     ax.set_facecolor('#2E3B4E')
@@ -37,15 +62,30 @@ def create_placeholder_image(title, filename, size=(640, 360)):
     # Remove axes
     ax.axis('off')
     
-    # Tight layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(filename, bbox_inches='tight')
-    plt.close()
+    # Save the figure at its fixed pixel size; skip the tight-bbox layout pass
+    # and use fast zlib compression since placeholders are throwaway cards
+    # Render into memory first so each file is written with a single call
+    _png_buffer.seek(0)
+    _png_buffer.truncate()
+    fig.savefig(_png_buffer, format='png', dpi=100, bbox_inches=None, pad_inches=0,
+                pil_kwargs={'compress_level': 1})
+    with _png_buffer.getbuffer() as png_bytes:
+        pathlib.Path(filename).write_bytes(png_bytes)
     
     print(f"Created placeholder image: {filename}")
 
+def _render_one(task):
+    """Render one (title, filename) placeholder, reusing this process's figure
+    
+    Module-level so it can be pickled and dispatched to a process pool.
+    """
+    global _worker_ax
+    if _worker_ax is None:
+        _worker_ax = _new_placeholder_figure().axes[0]
+    
+    title, filename = task
+    create_placeholder_image(title, filename, ax=_worker_ax)
+
 def main():
     """Create placeholder images for all experiments"""
     # Create directory for placeholders
@@ -65,18 +105,16 @@ def main():
         "trommel": "Trommel"
     }
     
-    # Create a placeholder image for each experiment
-    for exp_name, title in experiments.items():
-        create_placeholder_image(
-            title, 
-            f"videos/placeholders/{exp_name}_placeholder.png"
-        )
+    # One placeholder per experiment plus a generic one
+    tasks = [
+        (title, f"videos/placeholders/{exp_name}_placeholder.png")
+        for exp_name, title in experiments.items()
+    ]
+    tasks.append(("Chemical Engineering Experiment", "videos/placeholders/generic_placeholder.png"))
     
-    # Create a generic placeholder
-    create_placeholder_image(
-        "Chemical Engineering Experiment", 
-        "videos/placeholders/generic_placeholder.png"
-    )
+    # Images are independent, so render them across worker processes
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_render_one, tasks))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,19 +1,163 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import Rectangle, Circle
 import numpy as np
 import os
+import subprocess
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from matplotlib.gridspec import GridSpec
+from matplotlib.collections import EllipseCollection
 
-def create_batch_reactor_video(filename="videos/batch_reactor.mp4", duration=10, fps=30):
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy particle step is used without it
+    njit = None
+
+def _advance_particles(xs, ys, entry_ys, k, tau):
+    """Move PFR particles one step in place and return their RGB colors
+    
+    Particles past the outlet restart at the inlet with the height from entry_ys.
+    """
+    # Move all particles to the right
+    xs += 0.03
+    
+    # Particles that exit the reactor are reset to the entrance
+    exited = xs > 9
+    xs[exited] = 1.2
+    ys[exited] = entry_ys[exited]
+    
+    # Color based on position to represent reaction
+    # Map position 1-9 to reactor dimensionless position 0-1
+    z_L = (xs - 1) / 8
+    
+    # Calculate local conversion
+    local_conv = 1 - np.exp(-k * tau * z_L)
+    
+    # Red and green increase, blue decreases with conversion
+    colors = np.column_stack([
+        np.minimum(1, 0.2 + local_conv * 0.8),
+        np.minimum(1, 0.5 + local_conv * 0.5),
+        np.maximum(0, 1 - local_conv)
+    ])
+    colors[exited] = (0, 0, 1)  # Reset color to blue
+    return colors
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _advance_particles(xs, ys, entry_ys, k, tau):
+        """Per-particle loop form of the PFR particle step, compiled with numba"""
+        colors = np.empty((xs.shape[0], 3))
+        for j in range(xs.shape[0]):
+            x = xs[j] + 0.03
+            if x > 9:
+                # Reset to the entrance with a blue color
+                xs[j] = 1.2
+                ys[j] = entry_ys[j]
+                colors[j, 0] = 0.0
+                colors[j, 1] = 0.0
+                colors[j, 2] = 1.0
+            else:
+                xs[j] = x
+                local_conv = 1 - np.exp(-k * tau * (x - 1) / 8)
+                colors[j, 0] = min(1.0, 0.2 + local_conv * 0.8)
+                colors[j, 1] = min(1.0, 0.5 + local_conv * 0.5)
+                colors[j, 2] = max(0.0, 1 - local_conv)
+        return colors
+
+@functools.lru_cache(maxsize=None)
+def _best_codec(ffmpeg_path='ffmpeg'):
+    """Return 'h264_nvenc' if ffmpeg can encode on an NVIDIA GPU, else 'libx264'
+    
+    Builds often list h264_nvenc without a usable GPU, so a tiny test encode
+    confirms it actually works before it is chosen.
+    """
+    try:
+        encoders = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, check=True
+        ).stdout
+        if 'h264_nvenc' in encoders:
+            subprocess.run(
+                [ffmpeg_path, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+                 '-c:v', 'h264_nvenc', '-f', 'null', '-'],
+                capture_output=True, check=True
+            )
+            return 'h264_nvenc'
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return 'libx264'
+
+def _pipe_frames_to_ffmpeg(fig, filename, update, n_frames, fps, dpi=100, animated=()):
+    """Render n_frames of fig and stream the raw pixels straight into ffmpeg
+    
+    Args:
+        fig (matplotlib.figure.Figure): The figure to render
+        filename (str): The filename to save the video to
+        update (callable): Called with the frame index to update the artists
+        n_frames (int): Number of frames to render
+        fps (int): Frames per second
+        dpi (int): Resolution of the rendered frames
+        animated (iterable): Artists changed by update. Everything else is
+            rendered once as a cached background and restored each frame.
+    """
+    fig.set_dpi(dpi)
+    canvas = FigureCanvasAgg(fig)
+    
+    # Render the static scene once without the animated artists
+    for artist in animated:
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    width, height = canvas.get_width_height()
+    
+    ffmpeg_path = matplotlib.rcParams['animation.ffmpeg_path']
+    codec = _best_codec(ffmpeg_path)
+    if codec == 'h264_nvenc':
+        codec_args = ['-c:v', codec, '-preset', 'p1', '-qp', '23']
+    else:
+        codec_args = ['-c:v', codec, '-preset', 'veryfast']
+    
+    command = [
+        ffmpeg_path, '-y',
+        '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps),
+        '-i', '-',
+        *codec_args, '-pix_fmt', 'yuv420p',
+        filename
+    ]
+    proc = subprocess.Popen(command, stdin=subprocess.PIPE, bufsize=1 << 20)
+    try:
+        for i in range(n_frames):
+            update(i)
+            if animated:
+                canvas.restore_region(background)
+                for artist in animated:
+                    fig.draw_artist(artist)
+            else:
+                canvas.draw()
+            proc.stdin.write(canvas.buffer_rgba())
+    finally:
+        proc.stdin.close()
+        proc.wait()
+    
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+
+def create_batch_reactor_video(filename="videos/batch_reactor.mp4", duration=10, fps=30, dpi=80, seed=42):
     """Create a simple animation of a batch reactor process
     
     Args:
         filename (str): The filename to save the video to
         duration (int): The duration of the video in seconds
         fps (int): Frames per second
+        dpi (int): Resolution of the video frames (80 gives 960x480)
+        seed (int): Seed for the random bubble/particle placement, so runs are reproducible
     """
     # Create figure and subplots
-    fig = plt.figure(figsize=(12, 6))
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
     gs = GridSpec(2, 2, figure=fig)
     
     # Add title
@@ -31,7 +175,7 @@ def create_batch_reactor_video(filename="videos/batch_reactor.mp4", duration=10,
     ax1.axis('off')
     
     # Draw the reactor vessel
-    vessel = plt.Rectangle((3, 2), 4, 6, ec='black', fc='#d1e0e0', lw=2)
+    vessel = Rectangle((3, 2), 4, 6, ec='black', fc='#d1e0e0', lw=2)
     ax1.add_patch(vessel)
     
     # Draw inlet and outlet lines
@@ -39,8 +183,8 @@ def create_batch_reactor_video(filename="videos/batch_reactor.mp4", duration=10,
     ax1.plot([7, 9], [3, 3], 'k-', lw=2)
     
     # Draw inlet and outlet valves
-    inlet_valve = plt.Rectangle((1.5, 6.5), 0.5, 1, ec='black', fc='red', lw=1)
-    outlet_valve = plt.Rectangle((8, 2.5), 0.5, 1, ec='black', fc='red', lw=1)
+    inlet_valve = Rectangle((1.5, 6.5), 0.5, 1, ec='black', fc='red', lw=1)
+    outlet_valve = Rectangle((8, 2.5), 0.5, 1, ec='black', fc='red', lw=1)
     ax1.add_patch(inlet_valve)
     ax1.add_patch(outlet_valve)
     
@@ -74,44 +218,57 @@ def create_batch_reactor_video(filename="videos/batch_reactor.mp4", duration=10,
     line_conv, = ax3.plot([], [], 'r-', lw=2)
     
     # Create fluid in the reactor (will be updated for color change)
-    fluid = plt.Rectangle((3, 2), 4, 6, fc='#80b3ff', alpha=0.6)
+    fluid = Rectangle((3, 2), 4, 6, fc='#80b3ff', alpha=0.6)
     ax1.add_patch(fluid)
     
-    # Initialize lists to store data for plotting
-    t_data = []
-    conc_data = []
-    conv_data = []
+    # Fixed pool of bubbles, recycled oldest-first instead of adding new patches
+    n_bubbles = 10
+    bubbles = [Circle((0, 0), 0.2, fc='white', alpha=0.4, visible=False) for _ in range(n_bubbles)]
+    for bubble in bubbles:
+        ax1.add_patch(bubble)
+    bubble_idx = 0
+    
+    # Draw every frame's random bubble position and size up front (x, y, size per row)
+    rng_buf = np.random.default_rng(seed).random((duration * fps, 3))
+    
+    # Precompute the sampled curves for the whole video (every third frame is recorded)
+    # First-order reaction kinetics: C = C0 * exp(-k*t), X = 1 - C/C0
+    k = 0.3  # Rate constant
+    C0 = 1.0  # Initial concentration
+    all_t = (np.arange(0, duration * fps, 3) / fps).astype(np.float32)
+    all_conc = C0 * np.exp(-k * all_t)
+    all_conv = 1 - all_conc / C0
+    
+    # Lines keep the full time axis; samples not yet reached stay NaN and aren't drawn
+    shown_conc = np.full_like(all_conc, np.nan)
+    shown_conv = np.full_like(all_conv, np.nan)
     
     def init():
         """Initialize the animation"""
-        line_conc.set_data([], [])
-        line_conv.set_data([], [])
+        shown_conc[:] = np.nan
+        shown_conv[:] = np.nan
+        line_conc.set_data(all_t, shown_conc)
+        line_conv.set_data(all_t, shown_conv)
         fluid.set_facecolor('#80b3ff')
         fluid.set_alpha(0.6)
-        return line_conc, line_conv, fluid
+        for bubble in bubbles:
+            bubble.set_visible(False)
+        return (line_conc, line_conv, fluid, *bubbles)
     
     def animate(i):
         """Update the animation for frame i"""
-        t = i / fps
+        nonlocal bubble_idx
         
         # Only record data every few frames to prevent overcrowding
         if i % 3 == 0:
-            t_data.append(t)
-            
-            # Calculate concentration based on first-order reaction kinetics
-            # C = C0 * exp(-k*t)
-            k = 0.3  # Rate constant
-            C0 = 1.0  # Initial concentration
-            concentration = C0 * np.exp(-k * t)
-            conc_data.append(concentration)
-            
-            # Calculate conversion: X = 1 - C/C0
-            conversion = 1 - concentration / C0
-            conv_data.append(conversion)
+            n = i // 3 + 1  # Number of recorded samples so far
+            conversion = all_conv[n - 1]
             
-            # Update plots
-            line_conc.set_data(t_data, conc_data)
-            line_conv.set_data(t_data, conv_data)
+            # Reveal the newest sample on each curve
+            shown_conc[n - 1] = all_conc[n - 1]
+            shown_conv[n - 1] = all_conv[n - 1]
+            line_conc.set_ydata(shown_conc)
+            line_conv.set_ydata(shown_conv)
             
             # Update fluid color to represent reaction progression
             # Blend from blue to green as reaction proceeds
@@ -121,41 +278,40 @@ def create_batch_reactor_video(filename="videos/batch_reactor.mp4", duration=10,
             fluid.set_facecolor((r, g, b))
             
             # Add bubbles to represent reaction
-            if len(t_data) % 5 == 0 and conversion < 0.9:
-                bubble_x = 3 + np.random.rand() * 4
-                bubble_y = 2 + np.random.rand() * 6
-                bubble_size = 0.2 + np.random.rand() * 0.3
-                bubble = plt.Circle((bubble_x, bubble_y), bubble_size, fc='white', alpha=0.4)
-                ax1.add_patch(bubble)
+            if n % 5 == 0 and conversion < 0.9:
+                row = rng_buf[i]
+                bubble_x = 3 + row[0] * 4
+                bubble_y = 2 + row[1] * 6
+                bubble_size = 0.2 + row[2] * 0.3
                 
-                # Remove old bubbles to prevent clutter
-                if len(ax1.patches) > 15:  # Keep vessel, valves, fluid, and a few bubbles
-                    ax1.patches.pop(4)  # Remove oldest bubble (careful with the order!)
+                # Reuse the oldest bubble so only a few are ever on screen
+                bubble = bubbles[bubble_idx % n_bubbles]
+                bubble.center = (bubble_x, bubble_y)
+                bubble.radius = bubble_size
+                bubble.set_visible(True)
+                bubble_idx += 1
         
-        return line_conc, line_conv, fluid
+        return (line_conc, line_conv, fluid, *bubbles)
     
-    # Create animation
-    ani = animation.FuncAnimation(
-        fig, animate, frames=duration*fps, 
-        init_func=init, blit=True, interval=1000/fps
-    )
-    
-    # Save animation as mp4
-    ani.save(filename, writer='ffmpeg', fps=fps, dpi=100)
-    plt.close()
+    # Render every frame over the cached static scene and save as mp4
+    animated = init()
+    _pipe_frames_to_ffmpeg(fig, filename, animate, duration*fps, fps, dpi=dpi, animated=animated)
     
     print(f"Created batch reactor video: {filename}")
 
-def create_pfr_video(filename="videos/pfr.mp4", duration=10, fps=30):
+def create_pfr_video(filename="videos/pfr.mp4", duration=10, fps=30, dpi=80, seed=42):
     """Create a simple animation of a plug flow reactor process
     
     Args:
         filename (str): The filename to save the video to
         duration (int): The duration of the video in seconds
         fps (int): Frames per second
+        dpi (int): Resolution of the video frames (80 gives 960x480)
+        seed (int): Seed for the random bubble/particle placement, so runs are reproducible
     """
     # Create figure and subplots
-    fig = plt.figure(figsize=(12, 6))
+    fig = Figure(figsize=(12, 6))
+    FigureCanvasAgg(fig)
     gs = GridSpec(2, 2, figure=fig)
     
     # Add title
@@ -173,7 +329,7 @@ def create_pfr_video(filename="videos/pfr.mp4", duration=10, fps=30):
     ax1.axis('off')
     
     # Draw the PFR tube
-    pfr_tube = plt.Rectangle((1, 1), 8, 1, ec='black', fc='#d1d1e0', lw=2)
+    pfr_tube = Rectangle((1, 1), 8, 1, ec='black', fc='#d1d1e0', lw=2)
     ax1.add_patch(pfr_tube)
     
     # Draw inlet and outlet arrows
@@ -205,96 +361,65 @@ def create_pfr_video(filename="videos/pfr.mp4", duration=10, fps=30):
     line_conc, = ax2.plot([], [], 'b-', lw=2)
     line_conv, = ax3.plot([], [], 'r-', lw=2)
     
-    # Create particles to visualize flow (initial positions)
+    # Particles to visualize flow, stored as arrays and drawn as one collection
     n_particles = 15
-    particles = []
-    particle_colors = []
+    rng = np.random.default_rng(seed)
+    xs = np.empty(n_particles)  # Position along the reactor
+    ys = np.empty(n_particles)  # Position in the tube height
+    sizes = 0.05 + rng.random(n_particles) * 0.1  # Random particle size
+    
+    # One ellipse collection sized in data units, placed through its offsets
+    particles = EllipseCollection(
+        widths=2 * sizes, heights=2 * sizes, angles=0, units='xy',
+        offsets=np.zeros((n_particles, 2)), offset_transform=ax1.transData,
+        facecolors='blue', edgecolors='none', alpha=0.7
+    )
+    ax1.add_collection(particles)
+    
+    # Calculate profiles based on first-order reaction kinetics in a PFR
+    # For a first-order reaction: -dC/dz = k*C
+    # Solution: C/C0 = exp(-k*tau*z/L) where tau is the residence time
+    k = 3.0  # Rate constant
+    tau = 1.0  # Residence time
+    positions = np.linspace(0, 1, 50, dtype=np.float32)  # Dimensionless positions along the reactor
+    
+    # Calculate concentration profile: C/C0 = exp(-k*tau*z/L)
+    conc_profile = np.exp(-k * tau * positions)
+    
+    # Calculate conversion profile: X = 1 - C/C0
+    conv_profile = 1 - conc_profile
     
-    # Initialize lists to store profile data
-    positions = np.linspace(0, 1, 50)  # Dimensionless positions along the reactor
+    # Re-entry heights for every frame, drawn in one batch
+    entry_rand = rng.random((duration * fps, n_particles))
     
     def init():
         """Initialize the animation"""
-        line_conc.set_data([], [])
-        line_conv.set_data([], [])
+        # The steady-state profiles don't change between frames, so set them once
+        line_conc.set_data(positions, conc_profile)
+        line_conv.set_data(positions, conv_profile)
         
         # Initialize particles at random positions along the reactor
-        for i in range(n_particles):
-            x = 1 + np.random.rand() * 8  # Position along the reactor
-            y = 1.2 + np.random.rand() * 0.6  # Random position in the tube height
-            size = 0.05 + np.random.rand() * 0.1  # Random particle size
-            particle = plt.Circle((x, y), size, fc='blue', alpha=0.7)
-            ax1.add_patch(particle)
-            particles.append(particle)
-            particle_colors.append('blue')  # Initial color is blue
+        xs[:] = 1 + rng.random(n_particles) * 8
+        ys[:] = 1.2 + rng.random(n_particles) * 0.6
+        particles.set_offsets(np.column_stack([xs, ys]))
+        particles.set_facecolor('blue')  # Initial color is blue
             
-        return [line_conc, line_conv] + particles
+        return line_conc, line_conv, particles
     
     def animate(i):
         """Update the animation for frame i"""
-        t = i / fps
-        
-        # Calculate profiles based on first-order reaction kinetics in a PFR
-        # For a first-order reaction: -dC/dz = k*C
-        # Solution: C/C0 = exp(-k*tau*z/L) where tau is the residence time
-        k = 3.0  # Rate constant
-        tau = 1.0  # Residence time
+        # Advance particles; exiting ones re-enter at a random height
+        entry_ys = 1.2 + entry_rand[i] * 0.6
+        colors = _advance_particles(xs, ys, entry_ys, k, tau)
         
-        # Calculate concentration profile: C/C0 = exp(-k*tau*z/L)
-        conc_profile = np.exp(-k * tau * positions)
+        particles.set_offsets(np.column_stack([xs, ys]))
+        particles.set_facecolor(colors)
         
-        # Calculate conversion profile: X = 1 - C/C0
-        conv_profile = 1 - conc_profile
-        
-        # Update profile plots
-        line_conc.set_data(positions, conc_profile)
-        line_conv.set_data(positions, conv_profile)
-        
-        # Move particles along the reactor
-        for j, particle in enumerate(particles):
-            center = particle.center
-            
-            # Move particle to the right
-            new_x = center[0] + 0.03
-            
-            # If particle exits the reactor, reset to the entrance
-            if new_x > 9:
-                new_x = 1.2
-                center = (new_x, 1.2 + np.random.rand() * 0.6)
-                particle.center = center
-                particle_colors[j] = 'blue'  # Reset color
-                particle.set_facecolor('blue')
-            else:
-                # Update position
-                center = (new_x, center[1])
-                particle.center = center
-                
-                # Update color based on position to represent reaction
-                # Map position 1-9 to reactor dimensionless position 0-1
-                z_L = (new_x - 1) / 8
-                
-                # Calculate local conversion
-                local_conv = 1 - np.exp(-k * tau * z_L)
-                
-                # Update particle color based on conversion
-                r = min(1, 0.2 + local_conv * 0.8)  # Increase red component with conversion
-                g = min(1, 0.5 + local_conv * 0.5)  # Increase green component with conversion
-                b = max(0, 1 - local_conv)  # Decrease blue component with conversion
-                
-                particle.set_facecolor((r, g, b))
-                particle_colors[j] = (r, g, b)
-        
-        return [line_conc, line_conv] + particles
-    
-    # Create animation
-    ani = animation.FuncAnimation(
-        fig, animate, frames=duration*fps, 
-        init_func=init, blit=True, interval=1000/fps
-    )
+        return (particles,)
     
-    # Save animation as mp4
-    ani.save(filename, writer='ffmpeg', fps=fps, dpi=100)
-    plt.close()
+    # Render every frame over the cached static scene (including the fixed profiles) and save as mp4
+    init()
+    _pipe_frames_to_ffmpeg(fig, filename, animate, duration*fps, fps, dpi=dpi, animated=(particles,))
     
     print(f"Created PFR video: {filename}")
 
@@ -302,12 +427,16 @@ def main():
     """Create videos for experiments"""
     # Ensure ffmpeg is available
     try:
-        import matplotlib
         matplotlib.rcParams['animation.ffmpeg_path'] = 'ffmpeg'
         
-        # Create videos for some experiments
-        create_batch_reactor_video()
-        create_pfr_video()
+        # Create videos for some experiments; they share no state, so render them in parallel
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(create_batch_reactor_video),
+                executor.submit(create_pfr_video)
+            ]
+            for future in futures:
+                future.result()
         
         print("Videos created successfully!")
     except Exception as e:
@@ -1,220 +1,143 @@
 import streamlit as st
 import os
+from pathlib import Path
+
+# Directory holding the demo videos, generated images and placeholders: the
+# videos/ folder at the app root, where the generator scripts write when run
+# from there. Resolved from this file so the working directory doesn't matter.
+VIDEO_DIR = str(Path(__file__).resolve().parent.parent.parent / "videos")
+
+# Map experiment names to their titles for display
+EXPERIMENT_TITLES = {
+    "batch_reactor": "Isothermal Batch Reactor",
+    "semi_batch_reactor": "Isothermal Semi-batch Reactor",
+    "cstr": "Isothermal CSTR",
+    "pfr": "Isothermal PFR",
+    "crushers": "Crushers and Ball Mill",
+    "filter_press": "Plate and Frame Filter Press",
+    "rotary_vacuum_filter": "Rotary Vacuum Filter",
+    "centrifuge_flotation": "Centrifuge and Flotation",
+    "classifiers": "Classifiers",
+    "trommel": "Trommel"
+}
+
+# Generated image series shown in tabs when an experiment has no video yet:
+# (tab label, image file, caption)
+IMAGE_SERIES = {
+    "batch_reactor": [
+        ("t = 0 min", "batch_reactor_t0.png", "Batch Reactor at t = 0 minutes"),
+        ("t = 2 min", "batch_reactor_t2.png", "Batch Reactor at t = 2 minutes"),
+        ("t = 5 min", "batch_reactor_t5.png", "Batch Reactor at t = 5 minutes"),
+        ("t = 10 min", "batch_reactor_t10.png", "Batch Reactor at t = 10 minutes")
+    ],
+    "pfr": [
+        ("Flow Rate: 0.5", "pfr_flow0.5.png", "PFR with Flow Rate = 0.5 units"),
+        ("Flow Rate: 1.0", "pfr_flow1.0.png", "PFR with Flow Rate = 1.0 units"),
+        ("Flow Rate: 2.0", "pfr_flow2.0.png", "PFR with Flow Rate = 2.0 units"),
+        ("Flow Rate: 3.0", "pfr_flow3.0.png", "PFR with Flow Rate = 3.0 units")
+    ],
+    "cstr": [
+        ("τ = 0.5 min", "cstr_tau0.5.png", "CSTR with Residence Time = 0.5 minutes"),
+        ("τ = 1.0 min", "cstr_tau1.0.png", "CSTR with Residence Time = 1.0 minutes"),
+        ("τ = 2.0 min", "cstr_tau2.0.png", "CSTR with Residence Time = 2.0 minutes"),
+        ("τ = 5.0 min", "cstr_tau5.0.png", "CSTR with Residence Time = 5.0 minutes")
+    ]
+}
+
+def _list_dir(path):
+    """Return the file names in path, or an empty set if it doesn't exist"""
+    try:
+        return set(os.listdir(path))
+    except OSError:
+        return set()
+
+def _scan_videos_dir(video_dir=VIDEO_DIR):
+    """Build the demo media manifest with one listing of the videos directories
+
+    Returns:
+        dict: Experiment name -> {'video', 'images', 'placeholder'} entry, plus a
+            '_default' entry for experiments with nothing of their own
+    """
+    placeholder_dir = os.path.join(video_dir, "placeholders")
+    video_files = _list_dir(video_dir)
+    placeholder_files = _list_dir(placeholder_dir)
+
+    generic_placeholder = os.path.join(placeholder_dir, "generic_placeholder.png")
+    manifest = {'_default': {'video': None, 'images': None, 'placeholder': generic_placeholder}}
+
+    experiment_names = set(EXPERIMENT_TITLES) | set(IMAGE_SERIES)
+    experiment_names.update(f[:-len(".mp4")] for f in video_files if f.endswith(".mp4"))
+    experiment_names.update(
+        f[:-len("_placeholder.png")] for f in placeholder_files if f.endswith("_placeholder.png")
+    )
+
+    for experiment_name in experiment_names:
+        video_file = f"{experiment_name}.mp4"
+        placeholder_file = f"{experiment_name}_placeholder.png"
+        series = IMAGE_SERIES.get(experiment_name)
+
+        manifest[experiment_name] = {
+            'video': os.path.join(video_dir, video_file) if video_file in video_files else None,
+            'images': [
+                (label, os.path.join(video_dir, image_file), caption)
+                for label, image_file, caption in series
+            ] if series else None,
+            'placeholder': (
+                os.path.join(placeholder_dir, placeholder_file)
+                if placeholder_file in placeholder_files else generic_placeholder
+            )
+        }
+
+    return manifest
+
+@st.cache_data(ttl=60)
+def _manifest():
+    """Demo media manifest, rescanned at most once a minute so newly generated
+    videos and images show up without restarting the app"""
+    return _scan_videos_dir()
+
+@st.cache_data(max_entries=32, ttl=60)
+def _load_media(path):
+    """Read a demo video or image and keep its bytes cached across reruns; the
+    same one-minute expiry as the manifest picks up regenerated files"""
+    with open(path, "rb") as f:
+        return f.read()
 
 def display_demo_video(experiment_name):
     """Display a demonstration video for the specified experiment
-    
+
     Args:
         experiment_name (str): The name of the experiment to show a demo for
     """
+    from .descriptions import DESCRIPTIONS, DEFAULT_DESCRIPTION
+
     st.title(f"Demonstration Video: {experiment_name.replace('_', ' ').title()}")
-    
-    # Map experiment names to their titles for display
-    experiment_titles = {
-        "batch_reactor": "Isothermal Batch Reactor",
-        "semi_batch_reactor": "Isothermal Semi-batch Reactor",
-        "cstr": "Isothermal CSTR",
-        "pfr": "Isothermal PFR",
-        "crushers": "Crushers and Ball Mill",
-        "filter_press": "Plate and Frame Filter Press",
-        "rotary_vacuum_filter": "Rotary Vacuum Filter",
-        "centrifuge_flotation": "Centrifuge and Flotation",
-        "classifiers": "Classifiers",
-        "trommel": "Trommel"
-    }
-    
+
     # Get the title for the current experiment
-    title = experiment_titles.get(experiment_name, experiment_name.replace('_', ' ').title())
-    
-    # Video file path (assuming videos are stored in the videos directory with the same name as the experiment)
-    video_file = f"videos/{experiment_name}.mp4"
-    
-    # For now, we'll use placeholder images or generated images
-    # Check if the video file exists
-    if os.path.exists(video_file):
+    title = EXPERIMENT_TITLES.get(experiment_name, experiment_name.replace('_', ' ').title())
+
+    manifest = _manifest()
+    entry = manifest.get(experiment_name, manifest['_default'])
+
+    if entry['video']:
         # Display the video
-        st.video(video_file)
-    elif experiment_name == "batch_reactor":
-        # Show series of batch reactor images in tabs
-        st.info("This is a demonstration using sequential images. Video format coming soon!")
-        tabs = st.tabs(["t = 0 min", "t = 2 min", "t = 5 min", "t = 10 min"])
-        with tabs[0]:
-            st.image("videos/batch_reactor_t0.png", caption="Batch Reactor at t = 0 minutes")
-        with tabs[1]:
-            st.image("videos/batch_reactor_t2.png", caption="Batch Reactor at t = 2 minutes")
-        with tabs[2]:
-            st.image("videos/batch_reactor_t5.png", caption="Batch Reactor at t = 5 minutes")
-        with tabs[3]:
-            st.image("videos/batch_reactor_t10.png", caption="Batch Reactor at t = 10 minutes")
-    elif experiment_name == "pfr":
-        # Show series of PFR images in tabs
-        st.info("This is a demonstration using sequential images. Video format coming soon!")
-        tabs = st.tabs(["Flow Rate: 0.5", "Flow Rate: 1.0", "Flow Rate: 2.0", "Flow Rate: 3.0"])
-        with tabs[0]:
-            st.image("videos/pfr_flow0.5.png", caption="PFR with Flow Rate = 0.5 units")
-        with tabs[1]:
-            st.image("videos/pfr_flow1.0.png", caption="PFR with Flow Rate = 1.0 units")
-        with tabs[2]:
-            st.image("videos/pfr_flow2.0.png", caption="PFR with Flow Rate = 2.0 units")
-        with tabs[3]:
-            st.image("videos/pfr_flow3.0.png", caption="PFR with Flow Rate = 3.0 units")
-    elif experiment_name == "cstr":
-        # Show series of CSTR images in tabs
+        st.video(_load_media(entry['video']))
+    elif entry['images']:
+        # Show the series of generated images in tabs
         st.info("This is a demonstration using sequential images. Video format coming soon!")
-        tabs = st.tabs(["τ = 0.5 min", "τ = 1.0 min", "τ = 2.0 min", "τ = 5.0 min"])
-        with tabs[0]:
-            st.image("videos/cstr_tau0.5.png", caption="CSTR with Residence Time = 0.5 minutes")
-        with tabs[1]:
-            st.image("videos/cstr_tau1.0.png", caption="CSTR with Residence Time = 1.0 minutes")
-        with tabs[2]:
-            st.image("videos/cstr_tau2.0.png", caption="CSTR with Residence Time = 2.0 minutes")
-        with tabs[3]:
-            st.image("videos/cstr_tau5.0.png", caption="CSTR with Residence Time = 5.0 minutes")
+        tabs = st.tabs([label for label, _, _ in entry['images']])
+        for tab, (_, image_file, caption) in zip(tabs, entry['images']):
+            with tab:
+                st.image(_load_media(image_file), caption=caption)
     else:
         # Display a placeholder image from our generated placeholders
-        placeholder_file = f"videos/placeholders/{experiment_name}_placeholder.png"
-        if os.path.exists(placeholder_file):
-            st.image(placeholder_file, caption=f"{title} Demonstration Video (Coming Soon)")
-        else:
-            st.image("videos/placeholders/generic_placeholder.png", caption=f"{title} Demonstration Video (Coming Soon)")
+        st.image(_load_media(entry['placeholder']), caption=f"{title} Demonstration Video (Coming Soon)")
         st.info("The actual video for this experiment is under development.")
-    
+
     # Add description and context
     st.markdown(f"### About the {title} Experiment")
-    
-    # Custom descriptions for each experiment
-    if experiment_name == "batch_reactor":
-        st.markdown("""
-        This video demonstrates the operation of an isothermal batch reactor, showing:
-        
-        - How the system is loaded with reactants
-        - The reaction progress in real time
-        - Sampling procedures for concentration measurement
-        - Data collection and analysis
-        
-        Key concepts illustrated include stoichiometry, reaction kinetics, and conversion calculations.
-        """)
-        
-    elif experiment_name == "semi_batch_reactor":
-        st.markdown("""
-        This demonstration shows a semi-batch reactor in operation, highlighting:
-        
-        - Controlled addition of reactants over time
-        - Temperature control mechanisms
-        - Mixing patterns and efficiency
-        - Comparison with batch operation
-        
-        The video illustrates how semi-batch operation can improve selectivity and safety for exothermic reactions.
-        """)
-        
-    elif experiment_name == "cstr":
-        st.markdown("""
-        This video shows the continuous stirred tank reactor (CSTR) in action:
-        
-        - Steady-state operation with continuous feed and product removal
-        - Mixing patterns inside the reactor
-        - Temperature and flow rate control
-        - Steady-state vs. transient behavior
-        
-        The demonstration highlights how CSTR operation differs from batch processing and the implications for conversion.
-        """)
-        
-    elif experiment_name == "pfr":
-        st.markdown("""
-        This demonstration of a plug flow reactor (PFR) shows:
-        
-        - Fluid flow patterns through the tubular reactor
-        - Concentration gradient along the reactor length
-        - Residence time distribution effects
-        - Comparison with CSTR performance
-        
-        The video highlights the advantages of PFRs for certain reaction types and higher conversions.
-        """)
-        
-    elif experiment_name == "crushers":
-        st.markdown("""
-        This video demonstrates crusher and ball mill operation:
-        
-        - Feed material handling and classification
-        - Crushing mechanisms and principles
-        - Product size distribution analysis
-        - Energy consumption measurements
-        
-        The demonstration illustrates size reduction theories and equipment selection criteria.
-        """)
-        
-    elif experiment_name == "filter_press":
-        st.markdown("""
-        This demonstration shows a plate and frame filter press in operation:
-        
-        - Assembly of the filter plates and frames
-        - Slurry feed and filtration process
-        - Cake formation and washing
-        - Disassembly and cake removal
-        
-        The video illustrates filtration theory, resistance calculation, and operation cycles.
-        """)
-        
-    elif experiment_name == "rotary_vacuum_filter":
-        st.markdown("""
-        This demonstration of a rotary vacuum filter shows:
-        
-        - Continuous drum rotation through slurry
-        - Vacuum application and cake formation
-        - Washing and drying zones
-        - Cake discharge mechanisms
-        
-        The video highlights the advantages of continuous filtration over batch processes.
-        """)
-        
-    elif experiment_name == "centrifuge_flotation":
-        st.markdown("""
-        This video demonstrates both centrifuge and flotation operations:
-        
-        - Centrifugal separation principles
-        - Feed introduction and product removal
-        - Flotation cell operation and froth formation
-        - Recovery and grade measurements
-        
-        The demonstration illustrates separation techniques based on density and surface properties.
-        """)
-        
-    elif experiment_name == "classifiers":
-        st.markdown("""
-        This demonstration shows hydraulic classifiers in operation:
-        
-        - Particle settling in fluid environments
-        - Upward flow and classification zones
-        - Product stream collection and analysis
-        - Thickener operation principles
-        
-        The video illustrates how particle size and density affect separation efficiency.
-        """)
-        
-    elif experiment_name == "trommel":
-        st.markdown("""
-        This video demonstrates a trommel screen in operation:
-        
-        - Feed introduction and drum rotation
-        - Screening action and particle movement
-        - Oversize and undersize material collection
-        - Screen efficiency calculation
-        
-        The demonstration illustrates mechanical screening principles and equipment design.
-        """)
-        
-    else:
-        st.markdown("""
-        This demonstration video shows the key operational aspects of the experiment, including:
-        
-        - Equipment setup and configuration
-        - Process variables and their effects
-        - Data collection methodology
-        - Analysis techniques and interpretation
-        
-        The video provides a visual reference for the simulation you can interact with in the app.
-        """)
-    
+    st.markdown(DESCRIPTIONS.get(experiment_name, DEFAULT_DESCRIPTION))
+
     # Add call-to-action to try the simulation
     st.markdown("---")
-    st.info("Switch to 'Simulation' mode to interact with this experiment and adjust parameters yourself!")
\ No newline at end of file
+    st.info("Switch to 'Simulation' mode to interact with this experiment and adjust parameters yourself!")
@@ -0,0 +1,129 @@
+"""
+Demo Video Descriptions
+=======================
+
+Markdown descriptions shown under each experiment's demonstration video.
+"""
+
+DESCRIPTIONS = {
+    "batch_reactor": """
+This video demonstrates the operation of an isothermal batch reactor, showing:
+
+- How the system is loaded with reactants
+- The reaction progress in real time
+- Sampling procedures for concentration measurement
+- Data collection and analysis
+
+Key concepts illustrated include stoichiometry, reaction kinetics, and conversion calculations.
+""",
+
+    "semi_batch_reactor": """
+This demonstration shows a semi-batch reactor in operation, highlighting:
+
+- Controlled addition of reactants over time
+- Temperature control mechanisms
+- Mixing patterns and efficiency
+- Comparison with batch operation
+
+The video illustrates how semi-batch operation can improve selectivity and safety for exothermic reactions.
+""",
+
+    "cstr": """
+This video shows the continuous stirred tank reactor (CSTR) in action:
+
+- Steady-state operation with continuous feed and product removal
+- Mixing patterns inside the reactor
+- Temperature and flow rate control
+- Steady-state vs. transient behavior
+
+The demonstration highlights how CSTR operation differs from batch processing and the implications for conversion.
+""",
+
+    "pfr": """
+This demonstration of a plug flow reactor (PFR) shows:
+
+- Fluid flow patterns through the tubular reactor
+- Concentration gradient along the reactor length
+- Residence time distribution effects
+- Comparison with CSTR performance
+
+The video highlights the advantages of PFRs for certain reaction types and higher conversions.
+""",
+
+    "crushers": """
+This video demonstrates crusher and ball mill operation:
+
+- Feed material handling and classification
+- Crushing mechanisms and principles
+- Product size distribution analysis
+- Energy consumption measurements
+
+The demonstration illustrates size reduction theories and equipment selection criteria.
+""",
+
+    "filter_press": """
+This demonstration shows a plate and frame filter press in operation:
+
+- Assembly of the filter plates and frames
+- Slurry feed and filtration process
+- Cake formation and washing
+- Disassembly and cake removal
+
+The video illustrates filtration theory, resistance calculation, and operation cycles.
+""",
+
+    "rotary_vacuum_filter": """
+This demonstration of a rotary vacuum filter shows:
+
+- Continuous drum rotation through slurry
+- Vacuum application and cake formation
+- Washing and drying zones
+- Cake discharge mechanisms
+
+The video highlights the advantages of continuous filtration over batch processes.
+""",
+
+    "centrifuge_flotation": """
+This video demonstrates both centrifuge and flotation operations:
+
+- Centrifugal separation principles
+- Feed introduction and product removal
+- Flotation cell operation and froth formation
+- Recovery and grade measurements
+
+The demonstration illustrates separation techniques based on density and surface properties.
+""",
+
+    "classifiers": """
+This demonstration shows hydraulic classifiers in operation:
+
+- Particle settling in fluid environments
+- Upward flow and classification zones
+- Product stream collection and analysis
+- Thickener operation principles
+
+The video illustrates how particle size and density affect separation efficiency.
+""",
+
+    "trommel": """
+This video demonstrates a trommel screen in operation:
+
+- Feed introduction and drum rotation
+- Screening action and particle movement
+- Oversize and undersize material collection
+- Screen efficiency calculation
+
+The demonstration illustrates mechanical screening principles and equipment design.
+""",
+}
+
+DEFAULT_DESCRIPTION = """
+This demonstration video shows the key operational aspects of the experiment, including:
+
+- Equipment setup and configuration
+- Process variables and their effects
+- Data collection methodology
+- Analysis techniques and interpretation
+
+The video provides a visual reference for the simulation you can interact with in the app.
+"""